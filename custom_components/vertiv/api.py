@@ -0,0 +1,452 @@
+"""Client for the Vertiv PowerAssist local API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+import hashlib
+import logging
+import time
+from typing import Any, Final
+
+import aiohttp
+from aiohttp import ClientTimeout
+from yarl import URL
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import get_default_no_verify_context
+
+from .const import (
+    API_ENDPOINT,
+    CONFIG_REFRESH_INTERVAL_SECONDS,
+    CONNECT_TIMEOUT,
+    KEEPALIVE_TIMEOUT,
+    KEY_MAINTENANCE_MODE_GET,
+    KEY_MAINTENANCE_MODE_POST,
+    KEY_UNIQUE_ID,
+    MAX_CONNECTIONS_PER_HOST,
+    PROBE_TIMEOUT_SECONDS,
+    REQUEST_TIMEOUT,
+)
+from .metrics import EndpointMetrics
+from .models import (
+    CONFIG_FIELDS,
+    PowerAssistSnapshot,
+    ShutdownConfig,
+    UpsSnapshot,
+    parse_shutdown_config,
+    parse_ups_list,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+HEADERS: Final = {"Content-type": "application/json"}
+CLIENT_TIMEOUT: Final = ClientTimeout(
+    total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT, sock_read=REQUEST_TIMEOUT
+)
+PROBE_TIMEOUT: Final = ClientTimeout(total=PROBE_TIMEOUT_SECONDS)
+ENDPOINTS: Final = ("", "/ShutdownConfig", "/InMaintenanceMode", "/UpsName")
+# Optional endpoints fetched alongside the status, in fetch order
+CONFIG_ENDPOINTS: Final = ("/ShutdownConfig", "/InMaintenanceMode")
+
+# Errors from a secondary endpoint that must not fail the whole refresh.
+SECONDARY_ENDPOINT_ERRORS: Final = (
+    UpdateFailed,
+    aiohttp.ClientError,
+    TimeoutError,
+    ValueError,
+)
+
+
+class VertivPowerAssistApi:
+    """Class to communicate with the Vertiv PowerAssist API.
+
+    Each instance owns a dedicated, bounded pool of keep-alive HTTPS
+    connections to its host, so polling does not pay for a new TCP and TLS
+    handshake on every request. Call `async_close` when done with it.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, host: str, port: int, unique_id: str
+    ) -> None:
+        """Initialize the API object."""
+        self._hass = hass
+        self._host = host
+        self._unique_id = unique_id
+        base_url = URL.build(scheme="https", host=host, port=port)
+        self._urls: dict[str, URL] = {
+            endpoint: base_url.with_path(f"{API_ENDPOINT}{endpoint}")
+            for endpoint in ENDPOINTS
+        }
+        self._session: aiohttp.ClientSession | None = None
+        self._unsub_close: CALLBACK_TYPE | None = None
+        # Last known values of the secondary endpoints, reused when a fetch fails
+        self._shutdown_config: dict[str, Any] = {}
+        self._maintenance_mode: Any = None
+        # Monotonic time of the last complete fetch of the config endpoints
+        self._config_fetched_at: float | None = None
+        # Fingerprint of the last status body and the result built from it,
+        # the result is dropped whenever the cached config changes
+        self._status_fingerprint: bytes | None = None
+        self._last_result: PowerAssistSnapshot | None = None
+        self._config: ShutdownConfig | None = None
+        # Request metrics by "<method> <path>"
+        self.metrics: dict[str, EndpointMetrics] = {}
+        # Updates cut short by their deadline
+        self.poll_overruns = 0
+        # Config endpoints fetched by `async_update_data`, all unless narrowed
+        self.config_endpoints: frozenset[str] = frozenset(CONFIG_ENDPOINTS)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session of this host, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                # PowerAssist uses a self-signed certificate by default
+                ssl=get_default_no_verify_context(),
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=HEADERS,
+                timeout=CLIENT_TIMEOUT,
+            )
+            if self._unsub_close is None:
+                # Unlike the shared sessions, ours is not closed by Home Assistant
+                self._unsub_close = self._hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+                )
+        return self._session
+
+    async def _async_close_on_stop(self, event: Event) -> None:
+        """Close the connections to the host when Home Assistant stops."""
+        self._unsub_close = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the connections to the host."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _async_call_api(
+        self, endpoint: str, method: str = "GET", payload: dict[str, Any] | None = None
+    ) -> Any:
+        """Centralized method for API calls returning the decoded JSON body."""
+        raw = await self._async_request(endpoint, method, payload)
+        if raw is None:
+            return None
+        return self._decode(endpoint, method, raw)
+
+    @property
+    def status_metrics(self) -> EndpointMetrics:
+        """Return the metrics of the main status endpoint."""
+        return self._endpoint_metrics("", "GET")
+
+    def _endpoint_metrics(self, endpoint: str, method: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them on first use."""
+        key = f"{method} {API_ENDPOINT}{endpoint}"
+        if (metrics := self.metrics.get(key)) is None:
+            metrics = self.metrics[key] = EndpointMetrics()
+        return metrics
+
+    def _decode(self, endpoint: str, method: str, raw: bytes) -> Any:
+        """Decode a JSON body, counting malformed ones in the endpoint metrics."""
+        try:
+            return json_loads(raw)
+        except ValueError as err:
+            self._endpoint_metrics(endpoint, method).record_error("invalid_json", err)
+            _LOGGER.warning("Malformed JSON from %s: %s", self._host, err)
+            raise UpdateFailed(f"Malformed response from {self._host}") from err
+
+    async def _async_request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        payload: dict[str, Any] | None = None,
+        *,
+        timeout: ClientTimeout = CLIENT_TIMEOUT,
+        log_level: int = logging.WARNING,
+    ) -> bytes | None:
+        """Send a request and return the raw JSON body, if any.
+
+        The body is returned as read from the socket so it can be decoded
+        straight from bytes, without building an intermediate string.
+        """
+        metrics = self._endpoint_metrics(endpoint, method)
+        data = None if payload is None else json_bytes(payload)
+        start = time.monotonic()
+        try:
+            async with self._get_session().request(
+                method, self._urls[endpoint], data=data, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                body = None
+                if response.content_type == "application/json":
+                    body = await response.read()
+
+        except aiohttp.ClientConnectorError as err:
+            metrics.record_error("connection", err)
+            _LOGGER.log(log_level, "Connection failed for %s: %s", self._host, err)
+            raise UpdateFailed(f"Connection failed to {self._host}") from err
+        except aiohttp.ClientResponseError as err:
+            metrics.record_error(f"http_{err.status}", err)
+            _LOGGER.log(log_level, "Invalid response from %s: %s", self._host, err)
+            try:
+                error_body = await response.text()
+                _LOGGER.error("API response content on failure: %s", error_body)
+            except (aiohttp.ClientError, UnicodeDecodeError, RuntimeError):
+                pass
+            raise UpdateFailed(f"Invalid response from {self._host}") from err
+        except TimeoutError as err:
+            metrics.record_error("timeout", err)
+            _LOGGER.log(log_level, "Request timed out for %s: %s", self._host, err)
+            raise UpdateFailed("Request timed out") from err
+        except aiohttp.ClientError as err:
+            metrics.record_error(type(err).__name__, err)
+            raise
+        except asyncio.CancelledError as err:
+            metrics.record_error("cancelled", err)
+            raise
+        finally:
+            metrics.record_latency(time.monotonic() - start)
+
+        metrics.record_success(len(body) if body else 0)
+        return body
+
+    async def async_probe(self) -> None:
+        """Check that the host answers, with the cheapest request it serves.
+
+        Used while the host is considered down: a single small request with a
+        short timeout, whose failures are only logged at debug level.
+        """
+        await self._async_request(
+            "/InMaintenanceMode", timeout=PROBE_TIMEOUT, log_level=logging.DEBUG
+        )
+
+    async def async_identify(self) -> list[UpsSnapshot]:
+        """Return the UPS managed by the host, with a single status request.
+
+        Used by the config flow: the config endpoints are not fetched and UPS
+        without an identifier are skipped.
+        """
+        raw = await self._async_request(
+            "", timeout=PROBE_TIMEOUT, log_level=logging.DEBUG
+        )
+        main_data = None if raw is None else self._decode("", "GET", raw)
+        if not isinstance(main_data, list):
+            raise UpdateFailed(f"{self._host} is not a PowerAssist host")
+        return list(parse_ups_list(main_data, None).values())
+
+    @property
+    def config_is_stale(self) -> bool:
+        """Return True if the cached config endpoints need to be fetched again."""
+        return (
+            self._config_fetched_at is None
+            or time.monotonic() - self._config_fetched_at
+            >= CONFIG_REFRESH_INTERVAL_SECONDS
+        )
+
+    def invalidate_config(self) -> None:
+        """Force the config endpoints to be fetched on the next update."""
+        self._config_fetched_at = None
+
+    async def _async_gather_until(
+        self, requests: list[Coroutine[Any, Any, Any]], deadline: float | None
+    ) -> list[Any]:
+        """Run requests concurrently, returning their results or exceptions.
+
+        Requests not done by `deadline` are cancelled and reported as
+        `UpdateFailed`, so the caller gets whatever arrived in time.
+        """
+        tasks = [asyncio.ensure_future(request) for request in requests]
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            self.poll_overruns += 1
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+        return [
+            UpdateFailed(f"No answer from {self._host} within the poll deadline")
+            if task.cancelled()
+            else task.exception() or task.result()
+            for task in tasks
+        ]
+
+    async def async_update_data(
+        self, deadline: float | None = None
+    ) -> PowerAssistSnapshot:
+        """Fetch all necessary data from the Vertiv PowerAssist API.
+
+        The main endpoint lists every UPS managed by the host; each one is
+        parsed once into a typed snapshot, indexed by UPS unique identifier.
+        The live status is fetched on every call. The shutdown configuration
+        and maintenance mode only change through our own writes, so they are
+        cached and fetched again, concurrently with the status, once their
+        TTL expires or after `invalidate_config`, and only those listed in
+        `config_endpoints` are fetched at all. Only the main status
+        endpoint is mandatory; a failure on a config endpoint keeps its last
+        known value instead of failing the whole refresh.
+
+        When the status body is byte for byte identical to the previous one
+        and the cached config did not change, decoding is skipped and the
+        previous result object is returned as is.
+
+        `deadline`, in `time.monotonic` time, bounds the whole call: requests
+        still running when it passes are cancelled and count as failed.
+        """
+        config_endpoints = (
+            [
+                endpoint
+                for endpoint in CONFIG_ENDPOINTS
+                if endpoint in self.config_endpoints
+            ]
+            if self.config_is_stale
+            else []
+        )
+        requests = [self._async_request("", method="GET")]
+        requests.extend(
+            self._async_call_api(endpoint, method="GET")
+            for endpoint in config_endpoints
+        )
+
+        raw_main_data, *config_results = await self._async_gather_until(
+            requests, deadline
+        )
+
+        if isinstance(raw_main_data, BaseException):
+            raise raw_main_data
+        if not raw_main_data:
+            raise UpdateFailed("API returned empty or unexpected main data")
+
+        if config_endpoints:
+            self._update_config_cache(
+                dict(zip(config_endpoints, config_results, strict=True))
+            )
+
+        fingerprint = hashlib.blake2b(raw_main_data, digest_size=16).digest()
+        if fingerprint == self._status_fingerprint and self._last_result is not None:
+            return self._last_result
+
+        main_data = self._decode("", "GET", raw_main_data)
+        if not main_data or not isinstance(main_data, list):
+            raise UpdateFailed("API returned empty or unexpected main data")
+
+        # Fall back to the entry id for a single UPS missing its identifier
+        ups = parse_ups_list(main_data, self._unique_id)
+
+        self._status_fingerprint = fingerprint
+        self._last_result = PowerAssistSnapshot(ups=ups, config=self.config)
+        return self._last_result
+
+    @property
+    def config(self) -> ShutdownConfig:
+        """Return the last known shutdown configuration and maintenance mode."""
+        if self._config is None:
+            self._config = parse_shutdown_config(
+                self._shutdown_config, self._maintenance_mode
+            )
+        return self._config
+
+    def restore_config(self, config: ShutdownConfig) -> None:
+        """Seed the cached config with restored values.
+
+        The cache stays stale, so the values are only kept by polls skipping
+        the config endpoints, and are replaced as soon as they are fetched.
+        """
+        self._shutdown_config = {
+            key: value
+            for key, attr in CONFIG_FIELDS
+            if key != KEY_MAINTENANCE_MODE_GET
+            and (value := getattr(config, attr)) is not None
+        }
+        self._maintenance_mode = config.maintenance_mode
+        self._config_changed()
+
+    def _config_changed(self) -> None:
+        """Drop everything derived from the cached config."""
+        self._config = None
+        self._last_result = None
+
+    def _update_config_cache(self, results: dict[str, Any]) -> None:
+        """Store freshly fetched config endpoint results, by endpoint."""
+        fetched = True
+        self._config_changed()
+
+        if "/ShutdownConfig" in results:
+            shutdown_config_response = results["/ShutdownConfig"]
+            if isinstance(shutdown_config_response, BaseException):
+                self._handle_secondary_error(
+                    "/ShutdownConfig", shutdown_config_response
+                )
+                fetched = False
+            elif (
+                shutdown_config_response
+                and "shutdownConfig" in shutdown_config_response
+            ):
+                self._shutdown_config = shutdown_config_response["shutdownConfig"]
+
+        if "/InMaintenanceMode" in results:
+            maintenance_mode = results["/InMaintenanceMode"]
+            if isinstance(maintenance_mode, BaseException):
+                self._handle_secondary_error("/InMaintenanceMode", maintenance_mode)
+                fetched = False
+            else:
+                self._maintenance_mode = maintenance_mode
+
+        # A partial failure leaves the cache stale so it is retried next cycle
+        if fetched:
+            self._config_fetched_at = time.monotonic()
+
+    def _handle_secondary_error(self, endpoint: str, err: BaseException) -> None:
+        """Keep the last known value of a secondary endpoint that failed."""
+        if not isinstance(err, SECONDARY_ENDPOINT_ERRORS):
+            raise err
+        _LOGGER.debug(
+            "Fetching %s from %s failed, keeping last known value: %s",
+            endpoint,
+            self._host,
+            err,
+        )
+
+    async def async_set_shutdown_config(self, config: dict[str, Any]) -> None:
+        """Post the shutdown configuration to the API.
+
+        On success the cached configuration is updated with what was written,
+        so it can be published right away and the next write builds on it.
+        On failure the device state is unknown and the cache is invalidated.
+        """
+        try:
+            await self._async_call_api("/ShutdownConfig", method="POST", payload=config)
+        except BaseException:
+            self.invalidate_config()
+            raise
+        self._shutdown_config = {**self._shutdown_config, **config}
+        self._maintenance_mode = config.get(
+            KEY_MAINTENANCE_MODE_POST, self._maintenance_mode
+        )
+        self._config_changed()
+
+    async def async_fetch_shutdown_config(self) -> dict[str, Any]:
+        """Fetch only the shutdown configuration and replace the cached one."""
+        response = await self._async_call_api("/ShutdownConfig", method="GET")
+        if not response or "shutdownConfig" not in response:
+            raise UpdateFailed("API returned an unexpected shutdown configuration")
+        self._shutdown_config = response["shutdownConfig"]
+        # The maintenance mode itself is left to /InMaintenanceMode
+        self._config_changed()
+        return self._shutdown_config
+
+    async def async_set_ups_name(self, name: str, ups_id: str | None = None) -> None:
+        """Post the name of a UPS, by default the entry's own, to the API."""
+        payload = {KEY_UNIQUE_ID: ups_id or self._unique_id, "name": name}
+        await self._async_call_api("/UpsName", method="POST", payload=payload)
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -23,9 +23,9 @@ from .const import (
     KEY_IS_UPS_ON,
     KEY_LOW_CAPACITY_LIMIT,
     KEY_NEEDS_REPLACEMENT,
-    STATUS_KEY,
 )
-from .entity import VertivPowerAssistBaseEntity
+from .entity import VertivPowerAssistBaseEntity, async_setup_ups_entities
+from .models import UpsStatus
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -33,6 +33,7 @@ class VertivPowerAssistBinarySensorEntityDescription(BinarySensorEntityDescripti
     """Describes a Vertiv PowerAssist Binary Sensor Entity."""
 
     api_key: str
+    value_fn: Callable[[UpsStatus], bool | None]
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[
@@ -41,24 +42,28 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[
     VertivPowerAssistBinarySensorEntityDescription(
         key="ac_power_present",
         api_key=KEY_IS_AC_PRESENT,
+        value_fn=lambda status: status.is_ac_present,
         translation_key="ac_power_present",
         device_class=BinarySensorDeviceClass.POWER,
     ),
     VertivPowerAssistBinarySensorEntityDescription(
         key="battery_charging",
         api_key=KEY_IS_CHARGING,
+        value_fn=lambda status: status.is_charging,
         translation_key="battery_charging",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
     ),
     VertivPowerAssistBinarySensorEntityDescription(
         key="battery_discharging",
         api_key=KEY_IS_DISCHARGING,
+        value_fn=lambda status: status.is_discharging,
         translation_key="battery_discharging",
         device_class=BinarySensorDeviceClass.RUNNING,
     ),
     VertivPowerAssistBinarySensorEntityDescription(
         key="battery_needs_replacement",
         api_key=KEY_NEEDS_REPLACEMENT,
+        value_fn=lambda status: status.needs_replacement,
         translation_key="battery_needs_replacement",
         device_class=BinarySensorDeviceClass.BATTERY,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -66,6 +71,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[
     VertivPowerAssistBinarySensorEntityDescription(
         key="system_overload",
         api_key=KEY_IS_OVERLOAD,
+        value_fn=lambda status: status.is_overload,
         translation_key="system_overload",
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -73,6 +79,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[
     VertivPowerAssistBinarySensorEntityDescription(
         key="system_running",
         api_key=KEY_IS_UPS_ON,
+        value_fn=lambda status: status.is_ups_on,
         translation_key="system_running",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -80,6 +87,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[
     VertivPowerAssistBinarySensorEntityDescription(
         key="battery_low",
         api_key=KEY_LOW_CAPACITY_LIMIT,
+        value_fn=lambda status: status.below_capacity_limit,
         translation_key="battery_low",
         device_class=BinarySensorDeviceClass.BATTERY,
     ),
@@ -93,12 +101,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Vertiv PowerAssist binary sensors."""
 
-    entities = [
-        VertivPowerAssistBinarySensor(config_entry, description)
-        for description in BINARY_SENSOR_DESCRIPTIONS
-    ]
-
-    async_add_entities(entities)
+    async_setup_ups_entities(
+        config_entry,
+        async_add_entities,
+        lambda ups_id: (
+            VertivPowerAssistBinarySensor(config_entry, description, ups_id)
+            for description in BINARY_SENSOR_DESCRIPTIONS
+        ),
+    )
 
 
 class VertivPowerAssistBinarySensor(VertivPowerAssistBaseEntity, BinarySensorEntity):
@@ -110,22 +120,15 @@ class VertivPowerAssistBinarySensor(VertivPowerAssistBaseEntity, BinarySensorEnt
         self,
         entry: VertivPowerAssistConfigEntry,
         description: VertivPowerAssistBinarySensorEntityDescription,
+        ups_id: str,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(entry, description)
+        super().__init__(entry, description, ups_id)
         self.entity_description = description
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        data = self.coordinator.data
-        if not data:
-            return None
-
-        # Data is nested under "status"
-        status_data: dict[str, Any] | None = data.get(STATUS_KEY)
-        if status_data is None:
+        if (status := self.ups_status) is None:
             return None
-
-        # The API returns a boolean (true/false) directly
-        return status_data.get(self.entity_description.api_key)
+        return self.entity_description.value_fn(status)
@@ -2,19 +2,45 @@
 
 from __future__ import annotations
 
+from ipaddress import ip_network
 import logging
 from typing import Any
 
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_HOSTS,
+    CONF_NAME,
+    CONF_PORT,
+    CONF_SCAN_INTERVAL,
+    CONF_UNIQUE_ID,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
+from homeassistant.helpers.typing import DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from . import VertivPowerAssistApi
-from .const import DEFAULT_NAME, DEFAULT_PORT, DOMAIN, KEY_UNIQUE_ID
+from .api import VertivPowerAssistApi
+from .const import (
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_NETWORK,
+    DEFAULT_FAST_SCAN_INTERVAL_SECONDS,
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+    SCAN_INTERVAL_SECONDS,
+)
+from .discovery import DiscoveredHost, async_discover_hosts
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,30 +55,58 @@ DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): selector.TextSelector(),
     }
 )
+DISCOVER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NETWORK): selector.TextSelector(),
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1, max=65535, mode=selector.NumberSelectorMode.BOX
+            )
+        ),
+    }
+)
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate connectivity and get unique id from the device."""
+    """Validate connectivity and get unique id from the device.
+
+    Only the status endpoint is requested, once, with a short timeout.
+    """
     host = data[CONF_HOST]
     port = data[CONF_PORT]
 
-    temp_api = VertivPowerAssistApi(hass, host, f"{host}:{port}")
+    temp_api = VertivPowerAssistApi(hass, host, int(port), host)
 
     try:
-        info = await temp_api.async_test_connection()
-    except aiohttp.ClientConnectorError as err:
+        ups = await temp_api.async_identify()
+    except UpdateFailed as err:
+        if isinstance(err.__cause__, TimeoutError):
+            raise ConnectionError("timeout") from err
+        if isinstance(err.__cause__, aiohttp.ClientError):
+            raise ConnectionError("cannot_connect") from err
+        raise ValueError("invalid_response") from err
+    except aiohttp.ClientError as err:
         raise ConnectionError("cannot_connect") from err
-    except TimeoutError as err:
-        raise ConnectionError("timeout") from err
     except Exception as exc:
         _LOGGER.exception("Unexpected error during config validation")
         raise ConnectionError("unknown") from exc
+    finally:
+        await temp_api.async_close()
 
-    unique_id = info.get(KEY_UNIQUE_ID)
-    if not unique_id:
+    # The entry is identified by the first UPS; it also covers any other UPS
+    if not ups:
         raise ValueError("invalid_response")
 
-    return {"title": info.get("name", host), "unique_id": unique_id}
+    return {"title": ups[0].name or host, "unique_id": ups[0].ups_id}
+
+
+def _discovered_entry_data(discovered: DiscoveredHost) -> dict[str, Any]:
+    """Return the config entry data of a discovered host."""
+    return {
+        CONF_HOST: discovered.host,
+        CONF_PORT: discovered.port,
+        CONF_NAME: discovered.ups[0].name or DEFAULT_NAME,
+    }
 
 
 class VertivPowerAssistConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -61,12 +115,31 @@ class VertivPowerAssistConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
     MINOR_VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        # Hosts found by the last network scan, by "host:port"
+        self._discovered: dict[str, DiscoveredHost] = {}
+        # Entry data of the host to confirm, from another flow's scan
+        self._discovered_data: dict[str, Any] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Create the options flow."""
+        return VertivPowerAssistOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "discover"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add a host entered by the user."""
         if user_input is None:
-            return self.async_show_form(data_schema=DATA_SCHEMA)
+            return self.async_show_form(step_id="manual", data_schema=DATA_SCHEMA)
 
         errors: dict[str, str] = {}
         info: dict[str, Any] | None = None
@@ -86,4 +159,177 @@ class VertivPowerAssistConfigFlow(ConfigFlow, domain=DOMAIN):
         if not errors and info:
             return self.async_create_entry(title=info["title"], data=user_input)
 
-        return self.async_show_form(data_schema=DATA_SCHEMA, errors=errors)
+        return self.async_show_form(
+            step_id="manual", data_schema=DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Scan a network for PowerAssist hosts."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                network = ip_network(user_input[CONF_NETWORK], strict=False)
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                if network.num_addresses > DISCOVERY_MAX_HOSTS:
+                    errors[CONF_NETWORK] = "network_too_large"
+                else:
+                    hosts = await async_discover_hosts(
+                        network, int(user_input[CONF_PORT])
+                    )
+                    configured = self._async_current_ids()
+                    self._discovered = {
+                        f"{discovered.host}:{discovered.port}": discovered
+                        for discovered in hosts
+                        if discovered.ups[0].ups_id not in configured
+                    }
+                    if self._discovered:
+                        return await self.async_step_pick()
+                    errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=self.add_suggested_values_to_schema(
+                DISCOVER_SCHEMA, user_input
+            ),
+            errors=errors,
+            description_placeholders={"max_hosts": str(DISCOVERY_MAX_HOSTS)},
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add the discovered hosts picked by the user."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            picked = [self._discovered[key] for key in user_input[CONF_HOSTS]]
+            if picked:
+                # A flow creates a single entry, the other hosts are offered
+                # as discovered devices to confirm
+                for discovered in picked[1:]:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                            data={
+                                **_discovered_entry_data(discovered),
+                                CONF_UNIQUE_ID: discovered.ups[0].ups_id,
+                            },
+                        )
+                    )
+                first = picked[0]
+                await self.async_set_unique_id(first.ups[0].ups_id)
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=first.ups[0].name or first.host,
+                    data=_discovered_entry_data(first),
+                )
+            errors["base"] = "no_hosts_selected"
+
+        options = [
+            selector.SelectOptionDict(
+                value=key,
+                label=(
+                    f"{discovered.ups[0].name or DEFAULT_NAME} - {key}"
+                    f" ({len(discovered.ups)} UPS)"
+                ),
+            )
+            for key, discovered in self._discovered.items()
+        ]
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_HOSTS, default=list(self._discovered)
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(options=options, multiple=True)
+                ),
+            }
+        )
+        return self.async_show_form(step_id="pick", data_schema=schema, errors=errors)
+
+    async def async_step_integration_discovery(
+        self, discovery_info: DiscoveryInfoType
+    ) -> ConfigFlowResult:
+        """Handle a host picked in the network scan of another flow."""
+        await self.async_set_unique_id(discovery_info[CONF_UNIQUE_ID])
+        self._abort_if_unique_id_configured()
+        self._discovered_data = {
+            key: discovery_info[key] for key in (CONF_HOST, CONF_PORT, CONF_NAME)
+        }
+        self.context["title_placeholders"] = {
+            "name": discovery_info[CONF_NAME],
+            "host": discovery_info[CONF_HOST],
+        }
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add a discovered host once the user confirms it."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title=self._discovered_data[CONF_NAME], data=self._discovered_data
+            )
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders=self.context["title_placeholders"],
+        )
+
+
+class VertivPowerAssistOptionsFlow(OptionsFlow):
+    """Handle polling options for Vertiv PowerAssist."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling intervals."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            # Polling on battery must not be slower than on mains
+            if user_input[CONF_FAST_SCAN_INTERVAL] > user_input[CONF_SCAN_INTERVAL]:
+                errors[CONF_FAST_SCAN_INTERVAL] = "fast_slower_than_slow"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        # Show the rejected values again rather than the saved ones
+        options = user_input or self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_SECONDS),
+                ): vol.All(
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=5,
+                            max=300,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Coerce(int),
+                ),
+                vol.Required(
+                    CONF_FAST_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL_SECONDS
+                    ),
+                ): vol.All(
+                    selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=60,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Coerce(int),
+                ),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
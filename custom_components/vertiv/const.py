@@ -21,7 +21,48 @@ DEFAULT_PORT: Final = 8210
 API_ENDPOINT: Final = "/api/PowerAssist"
 
 SCAN_INTERVAL_SECONDS: Final = 20
+# Polling rate while on battery, without AC or below the low capacity limit
+CONF_FAST_SCAN_INTERVAL: Final = "fast_scan_interval"
+DEFAULT_FAST_SCAN_INTERVAL_SECONDS: Final = 2
+# Time the fast rate is kept after the last power event, to avoid flapping
+FAST_POLL_HOLD_SECONDS: Final = 60
 REQUEST_TIMEOUT: Final = 20
+# Share of the polling interval a whole poll may take before it is cut short
+POLL_BUDGET_RATIO: Final = 0.8
+MIN_POLL_BUDGET_SECONDS: Final = 1.5
+CONNECT_TIMEOUT: Final = 5
+# After this many failed polls in a row the host is only probed, backing off
+# exponentially from the polling interval up to BACKOFF_MAX_SECONDS
+CIRCUIT_BREAKER_THRESHOLD: Final = 3
+BACKOFF_MAX_SECONDS: Final = 300
+# Relative random spread of the backoff, so hosts do not retry in lockstep
+BACKOFF_JITTER: Final = 0.2
+PROBE_TIMEOUT_SECONDS: Final = 5
+# Dedicated keep-alive connection pool of each PowerAssist host
+MAX_CONNECTIONS_PER_HOST: Final = 4
+KEEPALIVE_TIMEOUT: Final = 60
+CONF_NETWORK: Final = "network"
+# Subnet discovery: hosts probed at once, per host timeouts, largest network
+DISCOVERY_CONCURRENCY: Final = 64
+DISCOVERY_CONNECT_TIMEOUT_SECONDS: Final = 1
+DISCOVERY_TIMEOUT_SECONDS: Final = 3
+DISCOVERY_MAX_HOSTS: Final = 1024
+# Upper bounds of the request latency histogram buckets
+LATENCY_BUCKETS_MS: Final = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Config changes made within this window are merged into a single POST
+WRITE_COALESCE_DELAY_SECONDS: Final = 0.3
+# Default of the writers: read /ShutdownConfig back after a write and roll back
+# if the device disagrees
+VERIFY_CONFIG_WRITES: Final = True
+# Shutdown config and maintenance mode only change through our own writes
+CONFIG_REFRESH_INTERVAL_SECONDS: Final = 300
+# Last good snapshot of each host, restored on startup before the first poll
+STORAGE_VERSION: Final = 1
+# Snapshot saves are coalesced, at most one write per host per window
+SNAPSHOT_SAVE_DELAY_SECONDS: Final = 60
+
+# Listener context namespace of the shutdown configuration
+DATA_CONFIG: Final = "config"
 
 KEY_UNIQUE_ID: Final = "upsUniqueIdentifier"
 KEY_MODEL: Final = "modelNumber"
@@ -61,6 +102,53 @@ KEY_MAINTENANCE_MODE_GET: Final = "maintenanceModeActive_get"
 KEY_ENABLE_SCRIPTED_SHUTDOWN: Final = "enableScriptedShutdown"
 KEY_SCRIPTED_SHUTDOWN_PATH: Final = "scriptedShutdownFilePath"
 
+# Config endpoints feeding each entity description key. The status endpoint
+# is always fetched; the others only while an enabled entity needs them.
+ENDPOINTS_BY_KEY: Final[dict[str, frozenset[str]]] = {
+    KEY_SHUTDOWN_TYPE: frozenset({"/ShutdownConfig"}),
+    KEY_BATT_TIME_MIN: frozenset({"/ShutdownConfig"}),
+    KEY_BATT_CAPACITY_PERCENT: frozenset({"/ShutdownConfig"}),
+    KEY_AFTER_X_MINUTES: frozenset({"/ShutdownConfig"}),
+    KEY_SHUTDOWN_IF_ALL: frozenset({"/ShutdownConfig"}),
+    KEY_ENABLE_SCRIPTED_SHUTDOWN: frozenset({"/ShutdownConfig"}),
+    KEY_MAINTENANCE_MODE_GET: frozenset({"/InMaintenanceMode"}),
+    "time_to_shutdown": frozenset({"/ShutdownConfig", "/InMaintenanceMode"}),
+}
+
+SHUTDOWN_TYPE_BY_MINUTES: Final = 0
+SHUTDOWN_TYPE_BY_PERCENT: Final = 1
+SHUTDOWN_TYPE_AFTER_X_MINUTES: Final = 2
+SHUTDOWN_TYPE_IMMEDIATELY: Final = 3
+# Option keys of the shutdown trigger, shared by the select and the service
+TYPE_INT_TO_KEY: Final[dict[int, str]] = {
+    SHUTDOWN_TYPE_BY_MINUTES: "by_minutes",
+    SHUTDOWN_TYPE_BY_PERCENT: "by_percent",
+    SHUTDOWN_TYPE_AFTER_X_MINUTES: "after_x",
+    SHUTDOWN_TYPE_IMMEDIATELY: "immediately",
+}
+TYPE_KEY_TO_INT: Final[dict[str, int]] = {v: k for k, v in TYPE_INT_TO_KEY.items()}
+# Shutdown config broadcast: hosts written at once, time allowed per host
+BROADCAST_CONCURRENCY: Final = 16
+BROADCAST_TIMEOUT_SECONDS: Final = 15
+# Accepted (min, max) of the shutdown thresholds, in minutes or percent
+BATTERY_TIME_MIN_RANGE: Final = (0, 120)
+BATTERY_CAPACITY_PERCENT_RANGE: Final = (5, 90)
+AFTER_X_MINUTES_RANGE: Final = (0, 300)
+
+# Events fired on the bus as soon as a poll shows a UPS transition
+EVENT_POWER_LOST: Final = f"{DOMAIN}_power_lost"
+EVENT_POWER_RESTORED: Final = f"{DOMAIN}_power_restored"
+EVENT_BATTERY_LOW: Final = f"{DOMAIN}_battery_low"
+EVENT_OVERLOAD: Final = f"{DOMAIN}_overload"
+
+# Time constant of the runtime and discharge rate smoothing
+FORECAST_TIME_CONSTANT_SECONDS: Final = 60
+
+# Samples kept at full resolution per UPS, then (bucket seconds, buckets)
+# of the downsampled tiers: 12 hours by minute and a week by quarter hour
+TELEMETRY_RAW_SAMPLES: Final = 1800
+TELEMETRY_TIERS: Final = ((60, 720), (900, 672))
+
 
 SHUTDOWN_TYPE_OPTIONS: Final = {
     0: "By Battery Minutes Remaining",
@@ -0,0 +1,362 @@
+"""Data update coordinators for the Vertiv PowerAssist integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    BACKOFF_JITTER,
+    BACKOFF_MAX_SECONDS,
+    CIRCUIT_BREAKER_THRESHOLD,
+    DATA_CONFIG,
+    DEFAULT_FAST_SCAN_INTERVAL_SECONDS,
+    DOMAIN,
+    EVENT_BATTERY_LOW,
+    EVENT_OVERLOAD,
+    EVENT_POWER_LOST,
+    EVENT_POWER_RESTORED,
+    FAST_POLL_HOLD_SECONDS,
+    MIN_POLL_BUDGET_SECONDS,
+    POLL_BUDGET_RATIO,
+    REQUEST_TIMEOUT,
+    SCAN_INTERVAL_SECONDS,
+)
+from .forecast import RuntimeEstimator, host_time_to_shutdown, is_on_battery
+from .models import CONFIG_FIELDS, STATUS_FIELDS, PowerAssistSnapshot, UpsSnapshot
+from .telemetry import UpsTelemetry
+
+if TYPE_CHECKING:
+    from .api import VertivPowerAssistApi
+    from .hub import VertivPowerAssistHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_power_event(ups: UpsSnapshot) -> bool:
+    """Return True if the UPS status calls for fast polling."""
+    status = ups.status
+    return (
+        status.is_discharging is True
+        or status.is_ac_present is False
+        or status.below_capacity_limit is True
+    )
+
+
+def changed_data_keys(
+    old: PowerAssistSnapshot, new: PowerAssistSnapshot
+) -> set[tuple[str, str | None]]:
+    """Return the API keys whose value differs between two snapshots.
+
+    Status keys are returned as `(ups_id, key)`, with `(ups_id, None)` when
+    the UPS appeared or disappeared, and config keys as `(DATA_CONFIG, key)`.
+    """
+    changed: set[tuple[str, str | None]] = set()
+
+    for ups_id in old.ups.keys() | new.ups.keys():
+        old_ups = old.ups.get(ups_id)
+        new_ups = new.ups.get(ups_id)
+        if old_ups is new_ups:
+            continue
+        if old_ups is None or new_ups is None:
+            changed.add((ups_id, None))
+            continue
+        old_status = old_ups.status
+        new_status = new_ups.status
+        changed.update(
+            (ups_id, key)
+            for key, attr in STATUS_FIELDS
+            if getattr(old_status, attr) != getattr(new_status, attr)
+        )
+
+    if old.config is not new.config:
+        changed.update(
+            (DATA_CONFIG, key)
+            for key, attr in CONFIG_FIELDS
+            if getattr(old.config, attr) != getattr(new.config, attr)
+        )
+
+    return changed
+
+
+def power_transitions(
+    old: PowerAssistSnapshot, new: PowerAssistSnapshot
+) -> list[tuple[str, str]]:
+    """Return the `(event_type, ups_id)` of the UPS transitions between snapshots.
+
+    Only edges are reported: a UPS that stays on battery over several polls
+    yields a single power lost transition. UPS that appeared or disappeared
+    are ignored.
+    """
+    transitions: list[tuple[str, str]] = []
+    for ups_id, new_ups in new.ups.items():
+        old_ups = old.ups.get(ups_id)
+        if old_ups is None or old_ups is new_ups:
+            continue
+        old_status = old_ups.status
+        new_status = new_ups.status
+        was_on_battery = is_on_battery(old_status)
+        if is_on_battery(new_status) != was_on_battery:
+            transitions.append(
+                (EVENT_POWER_RESTORED if was_on_battery else EVENT_POWER_LOST, ups_id)
+            )
+        if new_status.below_capacity_limit and not old_status.below_capacity_limit:
+            transitions.append((EVENT_BATTERY_LOW, ups_id))
+        if new_status.is_overload and not old_status.is_overload:
+            transitions.append((EVENT_OVERLOAD, ups_id))
+    return transitions
+
+
+class VertivPowerAssistCoordinator(DataUpdateCoordinator[PowerAssistSnapshot]):
+    """Coordinator polling a PowerAssist host at a rate driven by the UPS state.
+
+    There is one such coordinator per host, owned by its hub. Data is indexed
+    by UPS unique identifier, so a single request feeds every UPS managed by
+    the PowerAssist host. While any UPS is on battery, has lost AC or is
+    below its low capacity limit, the fast interval is used. Once every UPS
+    is back on mains, the fast interval is held for `FAST_POLL_HOLD_SECONDS`
+    before backing off to the slow interval, so a flapping input does not
+    toggle the rate.
+
+    Listeners are only called when a result differs from the previous one;
+    the API returns the very same object for an unchanged status body.
+
+    After `CIRCUIT_BREAKER_THRESHOLD` failed polls in a row the host is
+    considered down: its connections are closed, the interval backs off
+    exponentially with jitter up to `BACKOFF_MAX_SECONDS`, and each attempt
+    first sends a single cheap probe. The full fetch only follows a
+    successful probe, after which the normal cadence resumes.
+
+    Each poll gets a deadline of `POLL_BUDGET_RATIO` of the current interval,
+    so a slow host cannot make a cycle run into the next one.
+
+    Power transitions are fired as bus events as soon as a poll result is
+    parsed, before any entity state is written, so automations that only
+    care about them need not watch the binary sensors. They compare live
+    polls only, data restored from storage never triggers them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        api: VertivPowerAssistApi,
+    ) -> None:
+        """Initialize the coordinator."""
+        self._slow_interval = timedelta(seconds=SCAN_INTERVAL_SECONDS)
+        self._fast_interval = timedelta(seconds=DEFAULT_FAST_SCAN_INTERVAL_SECONDS)
+        # Monotonic time of the last sample that called for fast polling
+        self._last_power_event: float | None = None
+        self.consecutive_failures = 0
+        # Runtime model and sample history of each UPS, fed with every poll
+        self.estimators: dict[str, RuntimeEstimator] = {}
+        self.telemetry: dict[str, UpsTelemetry] = {}
+        self.api = api
+        self._host = name
+        # Last result of a live poll, the reference for power transitions
+        self._last_polled: PowerAssistSnapshot | None = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {name}",
+            update_interval=self._slow_interval,
+            config_entry=None,
+            always_update=False,
+        )
+
+    def set_intervals(self, slow: timedelta, fast: timedelta) -> None:
+        """Set the polling intervals used on mains and during power events."""
+        self._slow_interval = slow
+        self._fast_interval = fast
+        if not self.circuit_open:
+            self.update_interval = fast if self._last_power_event is not None else slow
+
+    @property
+    def poll_budget(self) -> float:
+        """Return the time a poll may take, in seconds, so it fits its interval."""
+        interval = (self.update_interval or self._slow_interval).total_seconds()
+        return min(
+            REQUEST_TIMEOUT, max(MIN_POLL_BUDGET_SECONDS, interval * POLL_BUDGET_RATIO)
+        )
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return True while the host is considered down and only probed."""
+        return self.consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD
+
+    async def _async_update_data(self) -> PowerAssistSnapshot:
+        """Fetch data and adapt the polling interval to the power state."""
+        try:
+            if self.circuit_open:
+                await self.api.async_probe()
+            data = await self.api.async_update_data(time.monotonic() + self.poll_budget)
+        except (UpdateFailed, aiohttp.ClientError, TimeoutError):
+            await self._async_record_failure()
+            raise
+
+        if self.circuit_open:
+            _LOGGER.info("%s is reachable again, resuming polling", self.name)
+        self.consecutive_failures = 0
+        self._adapt_update_interval(data)
+        self._record_samples(data)
+        if self._last_polled is not None and self._last_polled is not data:
+            self._fire_power_events(self._last_polled, data)
+        self._last_polled = data
+        return data
+
+    def _fire_power_events(
+        self, old: PowerAssistSnapshot, new: PowerAssistSnapshot
+    ) -> None:
+        """Fire an event for every UPS transition between two poll results.
+
+        The payload carries everything a shutdown automation needs, including
+        the forecast time to shutdown, so it does not have to read any state.
+        """
+        now = time.monotonic()
+        for event_type, ups_id in power_transitions(old, new):
+            ups = new.ups[ups_id]
+            time_to_shutdown = host_time_to_shutdown(
+                self.estimators[ups_id], now, new.config, new.ups
+            )
+            event_data: dict[str, Any] = {
+                "host": self._host,
+                "ups_id": ups_id,
+                "name": ups.name,
+                "remaining_capacity": ups.status.remaining_capacity,
+                "run_time_to_empty": ups.status.run_time_to_empty,
+                "time_to_shutdown": (
+                    None if time_to_shutdown is None else round(time_to_shutdown)
+                ),
+            }
+            _LOGGER.debug("%s: %s for UPS %s", self.name, event_type, ups_id)
+            self.hass.bus.async_fire(event_type, event_data)
+
+    def _record_samples(self, data: PowerAssistSnapshot) -> None:
+        """Feed the runtime model and history of every UPS with a poll result."""
+        now = time.monotonic()
+        timestamp = time.time()
+        for ups_id in self.estimators.keys() - data.ups.keys():
+            del self.estimators[ups_id]
+            self.telemetry.pop(ups_id, None)
+        for ups_id, ups in data.ups.items():
+            if (estimator := self.estimators.get(ups_id)) is None:
+                estimator = self.estimators[ups_id] = RuntimeEstimator()
+                self.telemetry[ups_id] = UpsTelemetry()
+            estimator.add_sample(now, ups.status)
+            self.telemetry[ups_id].add_sample(timestamp, ups.status)
+
+    async def _async_record_failure(self) -> None:
+        """Count a failed poll, backing off once the circuit is open."""
+        self.consecutive_failures += 1
+        if not self.circuit_open:
+            return
+        if self.consecutive_failures == CIRCUIT_BREAKER_THRESHOLD:
+            _LOGGER.debug("%s looks down, backing off", self.name)
+            # Release the pool, connections to a dead host are of no use
+            await self.api.async_close()
+
+        exponent = self.consecutive_failures - CIRCUIT_BREAKER_THRESHOLD + 1
+        backoff = min(
+            self._slow_interval.total_seconds() * 2**exponent, BACKOFF_MAX_SECONDS
+        )
+        backoff *= random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)
+        self.update_interval = timedelta(seconds=backoff)
+
+    def _adapt_update_interval(self, data: PowerAssistSnapshot) -> None:
+        """Switch between the fast and slow interval with hysteresis."""
+        now = time.monotonic()
+        if any(is_power_event(ups) for ups in data.ups.values()):
+            self._last_power_event = now
+        elif (
+            self._last_power_event is not None
+            and now - self._last_power_event >= FAST_POLL_HOLD_SECONDS
+        ):
+            self._last_power_event = None
+
+        interval = (
+            self._fast_interval
+            if self._last_power_event is not None
+            else self._slow_interval
+        )
+        if interval != self.update_interval:
+            _LOGGER.debug("Changing %s polling interval to %s", self.name, interval)
+            self.update_interval = interval
+
+
+class VertivPowerAssistEntryCoordinator(DataUpdateCoordinator[PowerAssistSnapshot]):
+    """Coordinator exposing a config entry's slice of its host's data.
+
+    It does not poll on its own: the hub pushes every result of the host
+    coordinator to it, and refresh requests are forwarded to the host.
+
+    Entities register with the data keys they depend on as listener context.
+    When new data is pushed, only listeners whose keys changed are called;
+    listeners without context are always called.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        hub: VertivPowerAssistHub,
+    ) -> None:
+        """Initialize the coordinator."""
+        self._entry_id = entry.entry_id
+        self._unique_id = entry.unique_id
+        self.hub = hub
+        # Data replaced by the last push, to find the listeners it affects
+        self._previous_data: PowerAssistSnapshot | None = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {entry.title}",
+            config_entry=entry,
+        )
+
+    @property
+    def primary_ups_id(self) -> str | None:
+        """Return the UPS matching the config entry, or the first one reported."""
+        ups = self.data.ups
+        if self._unique_id in ups:
+            return self._unique_id
+        return next(iter(ups), None)
+
+    @callback
+    def async_set_updated_data(self, data: PowerAssistSnapshot) -> None:
+        """Store new data, remembering the data it replaces."""
+        self._previous_data = self.data if self.last_update_success else None
+        super().async_set_updated_data(data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Only notify the listeners affected by the data last pushed."""
+        previous, self._previous_data = self._previous_data, None
+        if previous is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+
+        changed = changed_data_keys(previous, self.data)
+        if not changed:
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    async def _async_update_data(self) -> PowerAssistSnapshot:
+        """Return the entry's slice, refreshing the host if it has no data yet."""
+        return await self.hub.async_get_entry_data(self._entry_id)
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of the host the entry belongs to."""
+        await self.hub.coordinator.async_request_refresh()
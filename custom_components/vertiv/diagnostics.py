@@ -0,0 +1,65 @@
+"""Diagnostics support for the Vertiv PowerAssist integration."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import VertivPowerAssistConfigEntry
+
+TO_REDACT = {CONF_HOST, "serial_number"}
+
+
+def _redact_host(text: str | None, host: str) -> str | None:
+    """Hide the host in an error message, which usually names it."""
+    return None if text is None else text.replace(host, REDACTED)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: VertivPowerAssistConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hub = entry.runtime_data["hub"]
+    host_coordinator = hub.coordinator
+    entry_coordinator = entry.runtime_data["coordinator"]
+    data = entry_coordinator.data
+    host = entry.data[CONF_HOST]
+    endpoints = {
+        endpoint: metrics.as_dict() for endpoint, metrics in hub.api.metrics.items()
+    }
+    for endpoint_metrics in endpoints.values():
+        endpoint_metrics["last_error"] = _redact_host(
+            endpoint_metrics["last_error"], host
+        )
+
+    return async_redact_data(
+        {
+            "entry": {
+                "data": dict(entry.data),
+                "options": dict(entry.options),
+            },
+            "host": {
+                "entries": len(hub.entry_ids),
+                "update_interval": str(host_coordinator.update_interval),
+                "last_update_success": host_coordinator.last_update_success,
+                "last_exception": (
+                    None
+                    if host_coordinator.last_exception is None
+                    else _redact_host(repr(host_coordinator.last_exception), host)
+                ),
+                "consecutive_failures": host_coordinator.consecutive_failures,
+                "circuit_open": host_coordinator.circuit_open,
+                "poll_budget_seconds": host_coordinator.poll_budget,
+                "poll_overruns": hub.api.poll_overruns,
+                "config_endpoints": sorted(hub.api.config_endpoints),
+                "config_is_stale": hub.api.config_is_stale,
+            },
+            "endpoints": endpoints,
+            "data": None if data is None else dataclasses.asdict(data),
+        },
+        TO_REDACT,
+    )
@@ -0,0 +1,87 @@
+"""Discovery of PowerAssist hosts on a local network."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+from typing import Final
+
+import aiohttp
+from aiohttp import ClientTimeout
+from yarl import URL
+
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import get_default_no_verify_context
+
+from .const import (
+    API_ENDPOINT,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT_SECONDS,
+    DISCOVERY_TIMEOUT_SECONDS,
+)
+from .models import UpsSnapshot, parse_ups_list
+
+DISCOVERY_TIMEOUT: Final = ClientTimeout(
+    total=DISCOVERY_TIMEOUT_SECONDS, connect=DISCOVERY_CONNECT_TIMEOUT_SECONDS
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredHost:
+    """A PowerAssist host found on the network and the UPS it manages."""
+
+    host: str
+    port: int
+    ups: tuple[UpsSnapshot, ...]
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, host: str, port: int
+) -> DiscoveredHost | None:
+    """Return the host if it answers a status request like PowerAssist."""
+    url = URL.build(scheme="https", host=host, port=port, path=API_ENDPOINT)
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            main_data = json_loads(await response.read())
+    except (aiohttp.ClientError, TimeoutError, ValueError):
+        return None
+    if not isinstance(main_data, list):
+        return None
+    # UPS without an identifier cannot be told apart, they are skipped
+    ups = parse_ups_list(main_data, None)
+    return DiscoveredHost(host, port, tuple(ups.values())) if ups else None
+
+
+async def async_discover_hosts(
+    network: IPv4Network | IPv6Network, port: int
+) -> list[DiscoveredHost]:
+    """Return the PowerAssist hosts answering on `port` in a network.
+
+    Every address gets a single status request with a short connect timeout,
+    at most `DISCOVERY_CONCURRENCY` at a time, so a /24 is scanned in a few
+    seconds even when most addresses do not answer. The scan uses its own
+    session, without keep-alive as each host is asked only once.
+    """
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def _async_probe_address(
+        session: aiohttp.ClientSession, address: IPv4Address | IPv6Address
+    ) -> DiscoveredHost | None:
+        async with semaphore:
+            return await _async_probe(session, str(address), port)
+
+    connector = aiohttp.TCPConnector(
+        limit=DISCOVERY_CONCURRENCY,
+        force_close=True,
+        # PowerAssist uses a self-signed certificate by default
+        ssl=get_default_no_verify_context(),
+    )
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=DISCOVERY_TIMEOUT
+    ) as session:
+        results = await asyncio.gather(
+            *(_async_probe_address(session, address) for address in network.hosts())
+        )
+    return [result for result in results if result is not None]
@@ -2,35 +2,122 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+
 from homeassistant.const import CONF_NAME
-from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import VertivPowerAssistConfigEntry
-from .const import DEFAULT_NAME, DOMAIN, KEY_FIRMWARE_VERSION, KEY_MODEL
+from .const import DATA_CONFIG, DEFAULT_NAME, DOMAIN, ENDPOINTS_BY_KEY
+from .models import ShutdownConfig, UpsStatus
+
+
+@callback
+def async_setup_ups_entities(
+    entry: VertivPowerAssistConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entity_factory: Callable[[str], Iterable[Entity]],
+) -> None:
+    """Add entities for every UPS, including UPS that appear after setup."""
+    coordinator = entry.runtime_data["coordinator"]
+    known_ups_ids: set[str] = set()
+
+    @callback
+    def _async_add_new_ups() -> None:
+        new_ups_ids = [
+            ups_id for ups_id in coordinator.data.ups if ups_id not in known_ups_ids
+        ]
+        if not new_ups_ids:
+            return
+        known_ups_ids.update(new_ups_ids)
+        async_add_entities(
+            [entity for ups_id in new_ups_ids for entity in entity_factory(ups_id)]
+        )
+
+    _async_add_new_ups()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_ups))
 
 
 class VertivPowerAssistBaseEntity(CoordinatorEntity):
-    """Base class for all Vertiv PowerAssist entities."""
+    """Base class for all Vertiv PowerAssist entities.
+
+    Entities created with a `ups_id` report the status of that UPS and belong
+    to its device. Entities without one expose the host wide shutdown
+    configuration and belong to the device of the entry's primary UPS.
+    """
 
     _attr_has_entity_name = True
 
     def __init__(
-        self, entry: VertivPowerAssistConfigEntry, description: EntityDescription
+        self,
+        entry: VertivPowerAssistConfigEntry,
+        description: EntityDescription,
+        ups_id: str | None = None,
     ) -> None:
         """Initialize the Vertiv entity."""
+        coordinator = entry.runtime_data["coordinator"]
+        # Only wake up the entity when the data it is built from changes
+        context: frozenset[tuple[str, str | None]] | None
+        if ups_id is None:
+            context = frozenset({(DATA_CONFIG, description.key)})
+        else:
+            # Status entities read `api_key` from their UPS status, entities
+            # with an `api_key` of None depend on everything and always update
+            data_key: str | None = getattr(description, "api_key", description.key)
+            context = (
+                None
+                if data_key is None
+                else frozenset({(ups_id, None), (ups_id, data_key)})
+            )
 
-        super().__init__(entry.runtime_data["coordinator"])
+        super().__init__(coordinator, context)
         self._runtime_data = entry.runtime_data
-        coordinator = self._runtime_data["coordinator"]
-        ups_data = coordinator.data
-        unique_id = self._runtime_data["unique_id"]
+        primary_ups_id = coordinator.primary_ups_id
+        self._ups_id = ups_id or primary_ups_id
+        ups = coordinator.data.ups.get(self._ups_id)
+
+        if self._ups_id == primary_ups_id:
+            # Keep the identifiers used before multi-UPS support
+            device_id = self._runtime_data["unique_id"]
+            name = entry.data.get(CONF_NAME) or DEFAULT_NAME
+        else:
+            device_id = self._ups_id
+            name = (ups and ups.name) or f"{DEFAULT_NAME} {self._ups_id}"
+
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, unique_id)},
-            name=entry.data.get(CONF_NAME) or DEFAULT_NAME,
-            manufacturer=ups_data.get("manufacturer"),
-            model=ups_data.get(KEY_MODEL),
-            sw_version=ups_data.get(KEY_FIRMWARE_VERSION),
-            serial_number=ups_data.get("serialNumber"),
+            identifiers={(DOMAIN, device_id)},
+            name=name,
+            manufacturer=ups and ups.manufacturer,
+            model=ups and ups.model,
+            sw_version=ups and ups.version,
+            serial_number=ups and ups.serial_number,
         )
-        self._attr_unique_id = f"{unique_id}_{description.key}"
+        self._attr_unique_id = f"{device_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator and to the endpoints feeding the entity."""
+        await super().async_added_to_hass()
+        if endpoints := ENDPOINTS_BY_KEY.get(self.entity_description.key):
+            self.async_on_remove(
+                self._runtime_data["hub"].async_request_endpoints(endpoints)
+            )
+
+    @property
+    def available(self) -> bool:
+        """Return True if the UPS is still reported by PowerAssist."""
+        return super().available and self._ups_id in self.coordinator.data.ups
+
+    @property
+    def ups_status(self) -> UpsStatus | None:
+        """Return the latest status of the UPS backing this entity."""
+        if (ups := self.coordinator.data.ups.get(self._ups_id)) is None:
+            return None
+        return ups.status
+
+    @property
+    def config_data(self) -> ShutdownConfig:
+        """Return the latest host wide shutdown configuration."""
+        return self.coordinator.data.config
@@ -0,0 +1,137 @@
+"""Runtime and shutdown forecasts built from successive UPS samples."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import math
+
+from .const import (
+    FORECAST_TIME_CONSTANT_SECONDS,
+    SHUTDOWN_TYPE_AFTER_X_MINUTES,
+    SHUTDOWN_TYPE_BY_MINUTES,
+    SHUTDOWN_TYPE_BY_PERCENT,
+    SHUTDOWN_TYPE_IMMEDIATELY,
+)
+from .models import ShutdownConfig, UpsSnapshot, UpsStatus
+
+
+def is_on_battery(status: UpsStatus) -> bool:
+    """Return True if the UPS is running from its battery."""
+    return status.is_discharging is True or status.is_ac_present is False
+
+
+@dataclass(slots=True)
+class RuntimeEstimator:
+    """Incremental discharge model of a UPS, fed with one sample per poll.
+
+    Each sample is folded in O(1). While on battery, the runtime reported by
+    PowerAssist is smoothed with a filter expecting it to drop by one second
+    per second, so the estimate follows the trend without lagging behind
+    it, and the discharge rate is an exponentially weighted average of the
+    capacity slope. Weights depend on the time between samples, so a change
+    of polling interval does not change the smoothing. On mains the model
+    is reset and the reported runtime is used as is.
+    """
+
+    # Smoothed runtime, in seconds, as of `last_sample`
+    runtime: float | None = None
+    # Capacity lost per second while on battery, in percent
+    discharge_rate: float | None = None
+    capacity: float | None = None
+    # Monotonic times of the start of the outage and of the last sample
+    on_battery_since: float | None = None
+    last_sample: float | None = None
+
+    def add_sample(self, now: float, status: UpsStatus) -> None:
+        """Fold the status of a UPS polled at monotonic time `now` in."""
+        reported = status.run_time_to_empty
+        capacity = status.remaining_capacity
+
+        if not is_on_battery(status):
+            self.runtime = reported
+            self.discharge_rate = None
+            self.on_battery_since = None
+        elif self.on_battery_since is None or self.last_sample is None:
+            self.runtime = reported
+            self.discharge_rate = None
+            self.on_battery_since = now
+        elif (elapsed := now - self.last_sample) > 0:
+            weight = 1 - math.exp(-elapsed / FORECAST_TIME_CONSTANT_SECONDS)
+            if reported is not None:
+                if self.runtime is None:
+                    self.runtime = reported
+                else:
+                    predicted = max(self.runtime - elapsed, 0.0)
+                    self.runtime = predicted + weight * (reported - predicted)
+            if capacity is not None and self.capacity is not None:
+                slope = (self.capacity - capacity) / elapsed
+                if self.discharge_rate is None:
+                    self.discharge_rate = slope
+                else:
+                    self.discharge_rate += weight * (slope - self.discharge_rate)
+
+        self.capacity = capacity
+        self.last_sample = now
+
+    def runtime_at(self, now: float) -> float | None:
+        """Return the estimated runtime left at monotonic time `now`."""
+        if self.runtime is None or self.last_sample is None:
+            return None
+        if self.on_battery_since is None:
+            return self.runtime
+        return max(self.runtime - (now - self.last_sample), 0.0)
+
+    def time_to_shutdown(self, now: float, config: ShutdownConfig) -> float | None:
+        """Return the seconds left before the configured shutdown triggers.
+
+        Returns None while on mains, or when the trigger cannot be estimated.
+        """
+        if self.on_battery_since is None or config.maintenance_mode:
+            return None
+
+        shutdown_type = config.shutdown_type
+        if shutdown_type == SHUTDOWN_TYPE_BY_MINUTES:
+            runtime = self.runtime_at(now)
+            minutes = config.battery_time_remaining_minutes
+            if runtime is None or minutes is None:
+                return None
+            return max(runtime - minutes * 60, 0.0)
+        if shutdown_type == SHUTDOWN_TYPE_BY_PERCENT:
+            return self._time_to_capacity(now, config.battery_capacity_percent)
+        if shutdown_type == SHUTDOWN_TYPE_AFTER_X_MINUTES:
+            if config.after_x_minutes is None:
+                return None
+            on_battery_for = now - self.on_battery_since
+            return max(config.after_x_minutes * 60 - on_battery_for, 0.0)
+        if shutdown_type == SHUTDOWN_TYPE_IMMEDIATELY:
+            return 0.0
+        return None
+
+    def _time_to_capacity(self, now: float, threshold: int | None) -> float | None:
+        """Return the seconds left before the capacity drops to `threshold`."""
+        if threshold is None or self.capacity is None or self.last_sample is None:
+            return None
+        if self.capacity <= threshold:
+            return 0.0
+        if self.discharge_rate is not None and self.discharge_rate > 0:
+            time_left = (self.capacity - threshold) / self.discharge_rate
+            return max(time_left - (now - self.last_sample), 0.0)
+        # No measurable slope yet, assume the runtime is linear in capacity
+        if (runtime := self.runtime_at(now)) is None or self.capacity <= 0:
+            return None
+        return runtime * (self.capacity - threshold) / self.capacity
+
+
+def host_time_to_shutdown(
+    estimator: RuntimeEstimator,
+    now: float,
+    config: ShutdownConfig,
+    all_ups: Mapping[str, UpsSnapshot],
+) -> float | None:
+    """Return the seconds before a UPS triggers the shutdown of its host."""
+    if config.shutdown_if_all_ups_loses_power and not all(
+        is_on_battery(ups.status) for ups in all_ups.values()
+    ):
+        return None
+    return estimator.time_to_shutdown(now, config)
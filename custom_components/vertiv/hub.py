@@ -0,0 +1,302 @@
+"""Host level hub shared by the config entries of a PowerAssist host."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+import dataclasses
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import slugify
+
+from .api import VertivPowerAssistApi
+from .const import (
+    CONF_FAST_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL_SECONDS,
+    DOMAIN,
+    SCAN_INTERVAL_SECONDS,
+    SNAPSHOT_SAVE_DELAY_SECONDS,
+    STORAGE_VERSION,
+)
+from .coordinator import VertivPowerAssistCoordinator, VertivPowerAssistEntryCoordinator
+from .models import PowerAssistSnapshot, snapshot_from_dict
+from .writer import VertivPowerAssistConfigWriter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _snapshot_store(hass: HomeAssistant, key: str) -> Store[dict[str, Any]]:
+    """Return the store of the last good snapshot of a host."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{slugify(key)}")
+
+
+@callback
+def async_get_hub(
+    hass: HomeAssistant, host: str, port: int, unique_id: str
+) -> VertivPowerAssistHub:
+    """Return the hub of a PowerAssist host, creating it if needed."""
+    hubs: dict[str, VertivPowerAssistHub] = hass.data.setdefault(DOMAIN, {})
+    key = f"{host}:{port}"
+    if (hub := hubs.get(key)) is None:
+        api = VertivPowerAssistApi(hass, host, port, unique_id)
+        hub = hubs[key] = VertivPowerAssistHub(hass, key, api)
+    return hub
+
+
+async def async_release_hub(
+    hass: HomeAssistant, hub: VertivPowerAssistHub, entry_id: str
+) -> None:
+    """Detach a config entry from its hub, closing the hub once unused."""
+    if await hub.async_remove_entry(entry_id):
+        hass.data[DOMAIN].pop(hub.key, None)
+
+
+async def async_remove_snapshot(hass: HomeAssistant, host: str, port: int) -> None:
+    """Delete the saved snapshot of a host."""
+    await _snapshot_store(hass, f"{host}:{port}").async_remove()
+
+
+class VertivPowerAssistHub:
+    """Owns the single connection and poller of a PowerAssist host.
+
+    Every config entry pointing at the host subscribes with its own entry
+    coordinator and receives its slice of each poll result: an entry whose
+    unique id matches a UPS gets that UPS, and the first entry also gets any
+    UPS not claimed by another entry. N entries on one host therefore cost a
+    single request stream.
+
+    The last good result is saved, at most once per
+    `SNAPSHOT_SAVE_DELAY_SECONDS`, so the next startup can create every
+    entity from it without waiting for the host.
+
+    Entities declare the config endpoints they are built from while they
+    are added; the other config endpoints are not polled, so a host with
+    only status entities enabled costs a single request per cycle.
+
+    The request metric sensors describe the host itself, so a single entry
+    adds them: the first one whose sensor platform is loaded, then the next
+    one when it is unloaded.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, key: str, api: VertivPowerAssistApi
+    ) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.key = key
+        self.api = api
+        self.coordinator = VertivPowerAssistCoordinator(hass, key, api)
+        self.writer = VertivPowerAssistConfigWriter(hass, api, self.coordinator)
+        self._entries: dict[
+            str, tuple[ConfigEntry, VertivPowerAssistEntryCoordinator]
+        ] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._unsub_coordinator: CALLBACK_TYPE | None = None
+        self._store = _snapshot_store(hass, key)
+        # Added entities needing each config endpoint
+        self._endpoint_demand: Counter[str] = Counter()
+        # Callbacks adding the metric sensors, by entry, and the entry using it
+        self._metric_adders: dict[str, CALLBACK_TYPE] = {}
+        self._metrics_entry_id: str | None = None
+        api.config_endpoints = frozenset()
+
+    @property
+    def entry_ids(self) -> list[str]:
+        """Return the config entries subscribed to the host, first one first."""
+        return list(self._entries)
+
+    @callback
+    def async_add_entry(
+        self, entry: ConfigEntry, entry_coordinator: VertivPowerAssistEntryCoordinator
+    ) -> None:
+        """Subscribe a config entry to the data of the host."""
+        self._entries[entry.entry_id] = (entry, entry_coordinator)
+        self._update_intervals()
+        if self._unsub_coordinator is None:
+            self._unsub_coordinator = self.coordinator.async_add_listener(
+                self._async_dispatch
+            )
+
+    async def async_remove_entry(self, entry_id: str) -> bool:
+        """Unsubscribe a config entry, returning True if the hub is now unused."""
+        self._entries.pop(entry_id, None)
+        if self._entries:
+            self._update_intervals()
+            # The first entry may have changed, so slices must be recomputed
+            if self.coordinator.data is not None:
+                self._async_dispatch()
+            return False
+
+        if self._unsub_coordinator is not None:
+            self._unsub_coordinator()
+            self._unsub_coordinator = None
+        if self.coordinator.last_update_success and self.coordinator.data is not None:
+            # Write the pending save now, the hub is going away
+            await self._store.async_save(self._snapshot_to_save())
+        await self.coordinator.async_shutdown()
+        await self.api.async_close()
+        return True
+
+    @callback
+    def async_add_metrics_platform(
+        self, entry_id: str, add_metric_sensors: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Let an entry add the metric sensors, until the returned callback."""
+        self._metric_adders[entry_id] = add_metric_sensors
+        self._async_update_metrics_entry()
+
+        @callback
+        def _async_release() -> None:
+            del self._metric_adders[entry_id]
+            if self._metrics_entry_id == entry_id:
+                self._metrics_entry_id = None
+                self._async_update_metrics_entry()
+
+        return _async_release
+
+    @callback
+    def _async_update_metrics_entry(self) -> None:
+        """Add the metric sensors to the first entry able to, if none has."""
+        if self._metrics_entry_id is not None:
+            return
+        for entry_id in self._entries:
+            if (add_metric_sensors := self._metric_adders.get(entry_id)) is not None:
+                self._metrics_entry_id = entry_id
+                add_metric_sensors()
+                return
+
+    @callback
+    def async_request_endpoints(self, endpoints: Iterable[str]) -> CALLBACK_TYPE:
+        """Poll config endpoints for an entity, until the returned callback."""
+        endpoints = tuple(endpoints)
+        self._endpoint_demand.update(endpoints)
+        self._update_config_endpoints()
+
+        @callback
+        def _async_release() -> None:
+            self._endpoint_demand.subtract(endpoints)
+            self._update_config_endpoints()
+
+        return _async_release
+
+    def _update_config_endpoints(self) -> None:
+        """Only fetch the config endpoints some added entity depends on."""
+        wanted = frozenset(
+            endpoint for endpoint, count in self._endpoint_demand.items() if count > 0
+        )
+        added = wanted - self.api.config_endpoints
+        self.api.config_endpoints = wanted
+        if not added:
+            return
+        _LOGGER.debug("Polling %s on %s", ", ".join(sorted(added)), self.key)
+        # Fetch the newly needed endpoints now rather than at the next TTL
+        self.api.invalidate_config()
+        if self.coordinator.data is not None:
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+    def _update_intervals(self) -> None:
+        """Poll at the fastest rates requested by the subscribed entries."""
+        entries = [entry for entry, _ in self._entries.values()]
+        slow = min(
+            entry.options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_SECONDS)
+            for entry in entries
+        )
+        fast = min(
+            entry.options.get(
+                CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL_SECONDS
+            )
+            for entry in entries
+        )
+        self.coordinator.set_intervals(timedelta(seconds=slow), timedelta(seconds=fast))
+
+    async def async_restore(self) -> bool:
+        """Seed the host coordinator with the saved snapshot, if there is one.
+
+        Returns True if the coordinator was seeded; it then still needs a
+        live refresh.
+        """
+        if self.coordinator.data is not None:
+            return False
+        if (stored := await self._store.async_load()) is None:
+            return False
+        try:
+            snapshot = snapshot_from_dict(stored)
+        except (AttributeError, KeyError, TypeError) as err:
+            _LOGGER.debug("Ignoring the saved snapshot of %s: %r", self.key, err)
+            return False
+        if not snapshot.ups or self.coordinator.data is not None:
+            return False
+        _LOGGER.debug("Restored the last known data of %s", self.key)
+        # Polls skip the config endpoints no entity needs, keep their values
+        self.api.restore_config(snapshot.config)
+        self.coordinator.async_set_updated_data(snapshot)
+        return True
+
+    def _snapshot_to_save(self) -> dict[str, Any]:
+        """Return the current host data in a form suitable for storage."""
+        return dataclasses.asdict(self.coordinator.data)
+
+    async def async_get_entry_data(self, entry_id: str) -> PowerAssistSnapshot:
+        """Return the slice of an entry, refreshing the host if needed."""
+        async with self._refresh_lock:
+            if (
+                self.coordinator.data is None
+                or not self.coordinator.last_update_success
+            ):
+                await self.coordinator.async_refresh()
+
+        if not self.coordinator.last_update_success:
+            raise UpdateFailed(
+                f"Could not fetch data from {self.key}"
+            ) from self.coordinator.last_exception
+
+        return self._get_slice(entry_id)
+
+    def _get_slice(self, entry_id: str) -> PowerAssistSnapshot:
+        """Return the part of the host data belonging to a config entry."""
+        data = self.coordinator.data
+        entry = self._entries[entry_id][0]
+        all_ups = data.ups
+
+        if entry_id == next(iter(self._entries)):
+            claimed = {
+                other.unique_id
+                for other_id, (other, _) in self._entries.items()
+                if other_id != entry_id
+            }
+            ups = {
+                ups_id: ups_data
+                for ups_id, ups_data in all_ups.items()
+                if ups_id not in claimed
+            }
+        else:
+            ups = {
+                ups_id: ups_data
+                for ups_id, ups_data in all_ups.items()
+                if ups_id == entry.unique_id
+            }
+
+        return PowerAssistSnapshot(ups=ups, config=data.config)
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Push the latest host result to every subscribed entry."""
+        if self.coordinator.last_update_success:
+            self._store.async_delay_save(
+                self._snapshot_to_save, SNAPSHOT_SAVE_DELAY_SECONDS
+            )
+        for entry_id, (_, entry_coordinator) in self._entries.items():
+            if self.coordinator.last_update_success:
+                entry_coordinator.async_set_updated_data(self._get_slice(entry_id))
+            elif self.coordinator.last_exception is not None:
+                entry_coordinator.async_set_update_error(
+                    self.coordinator.last_exception
+                )
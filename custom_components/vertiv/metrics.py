@@ -0,0 +1,90 @@
+"""Request metrics of the PowerAssist API client."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import LATENCY_BUCKETS_MS
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters and latency histogram of the requests sent to an endpoint."""
+
+    requests: int = 0
+    bytes_received: int = 0
+    # Errors by kind: "timeout", "connection", "http_<status>", "invalid_json"...
+    errors: Counter[str] = field(default_factory=Counter)
+    # Requests per latency bucket, the last bucket has no upper bound
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    latency_total_ms: float = 0.0
+    last_latency_ms: float | None = None
+    last_success: datetime | None = None
+    # Monotonic time of the last success, for the time elapsed since
+    last_success_monotonic: float | None = None
+    last_error: str | None = None
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed requests."""
+        return sum(self.errors.values())
+
+    @property
+    def timeouts(self) -> int:
+        """Return the number of requests that timed out."""
+        return self.errors["timeout"]
+
+    def record_latency(self, latency: float) -> None:
+        """Record the duration of a request, in seconds."""
+        latency_ms = latency * 1000
+        self.requests += 1
+        self.latency_total_ms += latency_ms
+        self.last_latency_ms = latency_ms
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+    def record_success(self, size: int) -> None:
+        """Record a successful request that returned `size` bytes."""
+        self.bytes_received += size
+        self.last_success = dt_util.utcnow()
+        self.last_success_monotonic = time.monotonic()
+
+    def record_error(self, kind: str, err: BaseException) -> None:
+        """Record a failed request."""
+        self.errors[kind] += 1
+        self.last_error = f"{kind}: {err}"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics in a form suitable for diagnostics."""
+        since_success = (
+            None
+            if self.last_success_monotonic is None
+            else round(time.monotonic() - self.last_success_monotonic, 3)
+        )
+        bounds = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+        bounds.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "bytes_received": self.bytes_received,
+            "mean_latency_ms": (
+                round(self.latency_total_ms / self.requests, 1)
+                if self.requests
+                else None
+            ),
+            "last_latency_ms": (
+                None if self.last_latency_ms is None else round(self.last_latency_ms, 1)
+            ),
+            "latency_histogram": dict(zip(bounds, self.latency_buckets, strict=True)),
+            "last_success": self.last_success,
+            "seconds_since_last_success": since_success,
+            "last_error": self.last_error,
+        }
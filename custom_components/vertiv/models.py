@@ -0,0 +1,287 @@
+"""Typed snapshots of the data returned by the PowerAssist API."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+from .const import (
+    KEY_AFTER_X_MINUTES,
+    KEY_BATT_CAPACITY_PERCENT,
+    KEY_BATT_TIME_MIN,
+    KEY_BATTERY_VOLTAGE,
+    KEY_CAPACITY,
+    KEY_ENABLE_SCRIPTED_SHUTDOWN,
+    KEY_FIRMWARE_VERSION,
+    KEY_INPUT_VOLTAGES,
+    KEY_IS_AC_PRESENT,
+    KEY_IS_CHARGING,
+    KEY_IS_DISCHARGING,
+    KEY_IS_OVERLOAD,
+    KEY_IS_UPS_ON,
+    KEY_LOW_CAPACITY_LIMIT,
+    KEY_MAINTENANCE_MODE_GET,
+    KEY_MAINTENANCE_MODE_POST,
+    KEY_MODEL,
+    KEY_NEEDS_REPLACEMENT,
+    KEY_OUTPUT_VOLTAGES,
+    KEY_PERCENT_LOAD,
+    KEY_RUN_TIME,
+    KEY_SCRIPTED_SHUTDOWN_PATH,
+    KEY_SHUTDOWN_IF_ALL,
+    KEY_SHUTDOWN_TYPE,
+    KEY_UNIQUE_ID,
+    STATUS_KEY,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class UpsStatus:
+    """Live status of a UPS."""
+
+    run_time_to_empty: float | None
+    remaining_capacity: float | None
+    battery_voltage: float | None
+    percent_load: float | None
+    input_voltage: float | None
+    output_voltage: float | None
+    input_voltages: tuple[float, ...]
+    output_voltages: tuple[float, ...]
+    is_ac_present: bool | None
+    is_charging: bool | None
+    is_discharging: bool | None
+    needs_replacement: bool | None
+    is_overload: bool | None
+    is_ups_on: bool | None
+    below_capacity_limit: bool | None
+
+
+@dataclass(frozen=True, slots=True)
+class UpsSnapshot:
+    """Identity and live status of a UPS."""
+
+    ups_id: str
+    name: str | None
+    manufacturer: str | None
+    model: str | None
+    version: str | None
+    serial_number: str | None
+    status: UpsStatus
+
+
+@dataclass(frozen=True, slots=True)
+class ShutdownConfig:
+    """Host wide shutdown configuration and maintenance mode."""
+
+    shutdown_type: int | None
+    battery_time_remaining_minutes: int | None
+    battery_capacity_percent: int | None
+    after_x_minutes: int | None
+    shutdown_if_all_ups_loses_power: bool | None
+    maintenance_mode_active: bool | None
+    enable_scripted_shutdown: bool | None
+    scripted_shutdown_file_path: str | None
+    # As reported by /InMaintenanceMode, the source of truth for the mode
+    maintenance_mode: bool | None
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return the full ShutdownConfig POST payload for this configuration."""
+        maintenance_mode = self.maintenance_mode
+        if maintenance_mode is None:
+            maintenance_mode = self.maintenance_mode_active
+        return {
+            KEY_SHUTDOWN_TYPE: _or_default(self.shutdown_type, 0),
+            KEY_BATT_TIME_MIN: _or_default(self.battery_time_remaining_minutes, 0),
+            KEY_BATT_CAPACITY_PERCENT: _or_default(self.battery_capacity_percent, 0),
+            KEY_AFTER_X_MINUTES: _or_default(self.after_x_minutes, 0),
+            KEY_SHUTDOWN_IF_ALL: _or_default(
+                self.shutdown_if_all_ups_loses_power, False
+            ),
+            KEY_MAINTENANCE_MODE_POST: _or_default(maintenance_mode, False),
+            KEY_ENABLE_SCRIPTED_SHUTDOWN: _or_default(
+                self.enable_scripted_shutdown, False
+            ),
+            KEY_SCRIPTED_SHUTDOWN_PATH: _or_default(
+                self.scripted_shutdown_file_path, ""
+            ),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PowerAssistSnapshot:
+    """Everything known about a PowerAssist host after a poll."""
+
+    ups: Mapping[str, UpsSnapshot]
+    config: ShutdownConfig
+
+
+# API key to snapshot attribute, used to find which keys changed between polls
+STATUS_FIELDS: Final[tuple[tuple[str, str], ...]] = (
+    (KEY_RUN_TIME, "run_time_to_empty"),
+    (KEY_CAPACITY, "remaining_capacity"),
+    (KEY_BATTERY_VOLTAGE, "battery_voltage"),
+    (KEY_PERCENT_LOAD, "percent_load"),
+    (KEY_INPUT_VOLTAGES, "input_voltages"),
+    (KEY_OUTPUT_VOLTAGES, "output_voltages"),
+    (KEY_IS_AC_PRESENT, "is_ac_present"),
+    (KEY_IS_CHARGING, "is_charging"),
+    (KEY_IS_DISCHARGING, "is_discharging"),
+    (KEY_NEEDS_REPLACEMENT, "needs_replacement"),
+    (KEY_IS_OVERLOAD, "is_overload"),
+    (KEY_IS_UPS_ON, "is_ups_on"),
+    (KEY_LOW_CAPACITY_LIMIT, "below_capacity_limit"),
+)
+CONFIG_FIELDS: Final[tuple[tuple[str, str], ...]] = (
+    (KEY_SHUTDOWN_TYPE, "shutdown_type"),
+    (KEY_BATT_TIME_MIN, "battery_time_remaining_minutes"),
+    (KEY_BATT_CAPACITY_PERCENT, "battery_capacity_percent"),
+    (KEY_AFTER_X_MINUTES, "after_x_minutes"),
+    (KEY_SHUTDOWN_IF_ALL, "shutdown_if_all_ups_loses_power"),
+    (KEY_MAINTENANCE_MODE_POST, "maintenance_mode_active"),
+    (KEY_ENABLE_SCRIPTED_SHUTDOWN, "enable_scripted_shutdown"),
+    (KEY_SCRIPTED_SHUTDOWN_PATH, "scripted_shutdown_file_path"),
+    (KEY_MAINTENANCE_MODE_GET, "maintenance_mode"),
+)
+
+
+def _or_default(value: Any, default: Any) -> Any:
+    """Return `value`, or `default` if it is None."""
+    return default if value is None else value
+
+
+def _number(value: Any) -> float | None:
+    """Return a numeric reading, or None if the API sent something else."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _integer(value: Any) -> int | None:
+    """Return an integer setting, or None if the API sent something else."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return None
+
+
+def _flag(value: Any) -> bool | None:
+    """Return a boolean flag, or None if the API sent something else."""
+    return value if isinstance(value, bool) else None
+
+
+def _text(value: Any) -> str | None:
+    """Return a text field, or None if the API sent something else."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return None
+
+
+def _voltages(value: Any) -> tuple[float, ...]:
+    """Return every phase of a `{"voltages": [...]}` structure."""
+    if isinstance(value, dict):
+        value = value.get("voltages")
+    if isinstance(value, list):
+        phases = (_number(phase) for phase in value)
+        return tuple(phase for phase in phases if phase is not None)
+    if (phase := _number(value)) is not None:
+        return (phase,)
+    return ()
+
+
+def parse_ups_status(status: Mapping[str, Any]) -> UpsStatus:
+    """Build a UPS status from the `status` object of the main endpoint."""
+    input_voltages = _voltages(status.get(KEY_INPUT_VOLTAGES))
+    output_voltages = _voltages(status.get(KEY_OUTPUT_VOLTAGES))
+    return UpsStatus(
+        run_time_to_empty=_number(status.get(KEY_RUN_TIME)),
+        remaining_capacity=_number(status.get(KEY_CAPACITY)),
+        battery_voltage=_number(status.get(KEY_BATTERY_VOLTAGE)),
+        percent_load=_number(status.get(KEY_PERCENT_LOAD)),
+        input_voltage=input_voltages[0] if input_voltages else None,
+        output_voltage=output_voltages[0] if output_voltages else None,
+        input_voltages=input_voltages,
+        output_voltages=output_voltages,
+        is_ac_present=_flag(status.get(KEY_IS_AC_PRESENT)),
+        is_charging=_flag(status.get(KEY_IS_CHARGING)),
+        is_discharging=_flag(status.get(KEY_IS_DISCHARGING)),
+        needs_replacement=_flag(status.get(KEY_NEEDS_REPLACEMENT)),
+        is_overload=_flag(status.get(KEY_IS_OVERLOAD)),
+        is_ups_on=_flag(status.get(KEY_IS_UPS_ON)),
+        below_capacity_limit=_flag(status.get(KEY_LOW_CAPACITY_LIMIT)),
+    )
+
+
+def parse_ups(ups_id: str, ups_data: Mapping[str, Any]) -> UpsSnapshot:
+    """Build a UPS snapshot from one item of the main endpoint list."""
+    status = ups_data.get(STATUS_KEY)
+    return UpsSnapshot(
+        ups_id=ups_id,
+        name=_text(ups_data.get("name")),
+        manufacturer=_text(ups_data.get("manufacturer")),
+        model=_text(ups_data.get(KEY_MODEL)),
+        version=_text(ups_data.get(KEY_FIRMWARE_VERSION)),
+        serial_number=_text(ups_data.get("serialNumber")),
+        status=parse_ups_status(status if isinstance(status, dict) else {}),
+    )
+
+
+def parse_ups_list(
+    main_data: list[Any], fallback_id: str | None
+) -> dict[str, UpsSnapshot]:
+    """Parse the UPS list of the main endpoint, indexed by UPS identifier.
+
+    A first UPS without an identifier gets `fallback_id`, if any.
+    """
+    ups: dict[str, UpsSnapshot] = {}
+    for index, ups_data in enumerate(main_data):
+        if not isinstance(ups_data, dict):
+            continue
+        ups_id = ups_data.get(KEY_UNIQUE_ID) or (fallback_id if index == 0 else None)
+        if ups_id:
+            ups[ups_id] = parse_ups(ups_id, ups_data)
+    return ups
+
+
+def snapshot_from_dict(data: Mapping[str, Any]) -> PowerAssistSnapshot:
+    """Rebuild a snapshot saved with `dataclasses.asdict`."""
+    ups: dict[str, UpsSnapshot] = {}
+    for ups_id, ups_data in data["ups"].items():
+        status = {
+            **ups_data["status"],
+            "input_voltages": tuple(ups_data["status"]["input_voltages"]),
+            "output_voltages": tuple(ups_data["status"]["output_voltages"]),
+        }
+        ups[ups_id] = UpsSnapshot(**{**ups_data, "status": UpsStatus(**status)})
+    return PowerAssistSnapshot(ups=ups, config=ShutdownConfig(**data["config"]))
+
+
+def parse_shutdown_config(
+    shutdown_config: Mapping[str, Any], maintenance_mode: Any
+) -> ShutdownConfig:
+    """Build the configuration from /ShutdownConfig and /InMaintenanceMode."""
+    return ShutdownConfig(
+        shutdown_type=_integer(shutdown_config.get(KEY_SHUTDOWN_TYPE)),
+        battery_time_remaining_minutes=_integer(shutdown_config.get(KEY_BATT_TIME_MIN)),
+        battery_capacity_percent=_integer(
+            shutdown_config.get(KEY_BATT_CAPACITY_PERCENT)
+        ),
+        after_x_minutes=_integer(shutdown_config.get(KEY_AFTER_X_MINUTES)),
+        shutdown_if_all_ups_loses_power=_flag(shutdown_config.get(KEY_SHUTDOWN_IF_ALL)),
+        maintenance_mode_active=_flag(shutdown_config.get(KEY_MAINTENANCE_MODE_POST)),
+        enable_scripted_shutdown=_flag(
+            shutdown_config.get(KEY_ENABLE_SCRIPTED_SHUTDOWN)
+        ),
+        scripted_shutdown_file_path=_text(
+            shutdown_config.get(KEY_SCRIPTED_SHUTDOWN_PATH)
+        ),
+        maintenance_mode=_flag(maintenance_mode),
+    )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Final
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -16,51 +18,65 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import VertivPowerAssistConfigEntry
 from .const import (
+    AFTER_X_MINUTES_RANGE,
+    BATTERY_CAPACITY_PERCENT_RANGE,
+    BATTERY_TIME_MIN_RANGE,
     KEY_AFTER_X_MINUTES,
     KEY_BATT_CAPACITY_PERCENT,
     KEY_BATT_TIME_MIN,
-    KEY_ENABLE_SCRIPTED_SHUTDOWN,
-    KEY_MAINTENANCE_MODE_POST,
-    KEY_SCRIPTED_SHUTDOWN_PATH,
-    KEY_SHUTDOWN_IF_ALL,
-    KEY_SHUTDOWN_TYPE,
 )
 from .entity import VertivPowerAssistBaseEntity
+from .models import ShutdownConfig
 
-BATTERY_TIME_MIN_DESCRIPTION: Final[NumberEntityDescription] = NumberEntityDescription(
-    key=KEY_BATT_TIME_MIN,
-    translation_key="shutdown_battery_time_min",
-    icon="mdi:battery-clock",
-    native_unit_of_measurement=UnitOfTime.MINUTES,
-    mode=NumberMode.BOX,
-    native_min_value=0,
-    native_max_value=120,
-    native_step=1,
-)
-BATTERY_CAPACITY_PERCENT_DESCRIPTION: Final[NumberEntityDescription] = (
-    NumberEntityDescription(
-        key=KEY_BATT_CAPACITY_PERCENT,
-        translation_key="shutdown_battery_capacity_percent",
-        icon="mdi:battery-20",
-        native_unit_of_measurement=PERCENTAGE,
+
+@dataclass(frozen=True, kw_only=True)
+class VertivPowerAssistNumberEntityDescription(NumberEntityDescription):
+    """Describes a Vertiv PowerAssist Number Entity."""
+
+    value_fn: Callable[[ShutdownConfig], int | None]
+
+
+BATTERY_TIME_MIN_DESCRIPTION: Final[VertivPowerAssistNumberEntityDescription] = (
+    VertivPowerAssistNumberEntityDescription(
+        key=KEY_BATT_TIME_MIN,
+        value_fn=lambda config: config.battery_time_remaining_minutes,
+        translation_key="shutdown_battery_time_min",
+        icon="mdi:battery-clock",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
         mode=NumberMode.BOX,
-        native_min_value=5,
-        native_max_value=90,
+        native_min_value=BATTERY_TIME_MIN_RANGE[0],
+        native_max_value=BATTERY_TIME_MIN_RANGE[1],
         native_step=1,
     )
 )
-AFTER_X_MINUTES_DESCRIPTION: Final[NumberEntityDescription] = NumberEntityDescription(
-    key=KEY_AFTER_X_MINUTES,
-    translation_key="shutdown_after_x_minutes",
-    icon="mdi:timer-sand-full",
-    native_unit_of_measurement=UnitOfTime.MINUTES,
+BATTERY_CAPACITY_PERCENT_DESCRIPTION: Final[
+    VertivPowerAssistNumberEntityDescription
+] = VertivPowerAssistNumberEntityDescription(
+    key=KEY_BATT_CAPACITY_PERCENT,
+    value_fn=lambda config: config.battery_capacity_percent,
+    translation_key="shutdown_battery_capacity_percent",
+    icon="mdi:battery-20",
+    native_unit_of_measurement=PERCENTAGE,
     mode=NumberMode.BOX,
-    native_min_value=0,
-    native_max_value=300,
+    native_min_value=BATTERY_CAPACITY_PERCENT_RANGE[0],
+    native_max_value=BATTERY_CAPACITY_PERCENT_RANGE[1],
     native_step=1,
 )
+AFTER_X_MINUTES_DESCRIPTION: Final[VertivPowerAssistNumberEntityDescription] = (
+    VertivPowerAssistNumberEntityDescription(
+        key=KEY_AFTER_X_MINUTES,
+        value_fn=lambda config: config.after_x_minutes,
+        translation_key="shutdown_after_x_minutes",
+        icon="mdi:timer-sand-full",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        mode=NumberMode.BOX,
+        native_min_value=AFTER_X_MINUTES_RANGE[0],
+        native_max_value=AFTER_X_MINUTES_RANGE[1],
+        native_step=1,
+    )
+)
 
-NUMBER_DESCRIPTIONS: Final[list[NumberEntityDescription]] = [
+NUMBER_DESCRIPTIONS: Final[list[VertivPowerAssistNumberEntityDescription]] = [
     BATTERY_TIME_MIN_DESCRIPTION,
     BATTERY_CAPACITY_PERCENT_DESCRIPTION,
     AFTER_X_MINUTES_DESCRIPTION,
@@ -86,48 +102,25 @@ async def async_setup_entry(
 class VertivPowerAssistNumberEntity(VertivPowerAssistBaseEntity, NumberEntity):
     """Represents a configurable numeric threshold for UPS shutdown."""
 
+    entity_description: VertivPowerAssistNumberEntityDescription
+
     def __init__(
         self,
         entry: VertivPowerAssistConfigEntry,
         coordinator: DataUpdateCoordinator,
-        description: NumberEntityDescription,
+        description: VertivPowerAssistNumberEntityDescription,
     ) -> None:
         """Initialize the number entity."""
         super().__init__(entry, description)
         self.entity_description = description
-        self._api = entry.runtime_data["api"]
+        self._writer = entry.runtime_data["hub"].writer
 
     @property
     def native_value(self) -> float | None:
         """Return the current value of the number entity."""
-        raw_value = self.coordinator.data.get(self.entity_description.key)
-
-        if isinstance(raw_value, (int, float)):
-            return float(raw_value)
-
-        return None
+        value = self.entity_description.value_fn(self.config_data)
+        return None if value is None else float(value)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-
-        current_config: dict[str, Any] = {
-            KEY_SHUTDOWN_TYPE: self.coordinator.data.get(KEY_SHUTDOWN_TYPE, 0),
-            KEY_BATT_TIME_MIN: self.coordinator.data.get(KEY_BATT_TIME_MIN, 0),
-            KEY_BATT_CAPACITY_PERCENT: self.coordinator.data.get(
-                KEY_BATT_CAPACITY_PERCENT, 0
-            ),
-            KEY_AFTER_X_MINUTES: self.coordinator.data.get(KEY_AFTER_X_MINUTES, 0),
-            KEY_SHUTDOWN_IF_ALL: self.coordinator.data.get(KEY_SHUTDOWN_IF_ALL, False),
-            KEY_MAINTENANCE_MODE_POST: self.coordinator.data.get(
-                KEY_MAINTENANCE_MODE_POST, False
-            ),
-            KEY_ENABLE_SCRIPTED_SHUTDOWN: self.coordinator.data.get(
-                KEY_ENABLE_SCRIPTED_SHUTDOWN, False
-            ),
-            KEY_SCRIPTED_SHUTDOWN_PATH: self.coordinator.data.get(
-                KEY_SCRIPTED_SHUTDOWN_PATH, ""
-            ),
-        }
-        current_config[self.entity_description.key] = int(value)
-        await self._api.async_set_shutdown_config(current_config)
-        await self.coordinator.async_request_refresh()
+        await self._writer.async_write({self.entity_description.key: int(value)})
@@ -10,27 +10,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import VertivPowerAssistConfigEntry
-from .const import (
-    KEY_AFTER_X_MINUTES,
-    KEY_BATT_CAPACITY_PERCENT,
-    KEY_BATT_TIME_MIN,
-    KEY_ENABLE_SCRIPTED_SHUTDOWN,
-    KEY_MAINTENANCE_MODE_POST,
-    KEY_SCRIPTED_SHUTDOWN_PATH,
-    KEY_SHUTDOWN_IF_ALL,
-    KEY_SHUTDOWN_TYPE,
-)
+from .const import KEY_SHUTDOWN_TYPE, TYPE_INT_TO_KEY, TYPE_KEY_TO_INT
 from .entity import VertivPowerAssistBaseEntity
 
-TYPE_INT_TO_KEY: Final[dict[int, str]] = {
-    0: "by_minutes",
-    1: "by_percent",
-    2: "after_x",
-    3: "immediately",
-}
-
-TYPE_KEY_TO_INT: Final[dict[str, int]] = {v: k for k, v in TYPE_INT_TO_KEY.items()}
-
 SHUTDOWN_TRIGGER_TYPE_DESCRIPTION: Final[SelectEntityDescription] = (
     SelectEntityDescription(
         key=KEY_SHUTDOWN_TYPE,
@@ -69,19 +51,19 @@ class VertivPowerAssistSelectEntity(VertivPowerAssistBaseEntity, SelectEntity):
         """Initialize the select entity."""
         super().__init__(entry, description)
         self.entity_description = description
-        self._api = entry.runtime_data["api"]
+        self._writer = entry.runtime_data["hub"].writer
 
         self._attr_options = list(TYPE_INT_TO_KEY.values())
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        raw_value = self.coordinator.data.get(self.entity_description.key)
+        shutdown_type = self.config_data.shutdown_type
 
-        if isinstance(raw_value, int) and raw_value in TYPE_INT_TO_KEY:
-            return TYPE_INT_TO_KEY[raw_value]
+        if shutdown_type is None:
+            return None
 
-        return None
+        return TYPE_INT_TO_KEY.get(shutdown_type)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -92,27 +74,4 @@ class VertivPowerAssistSelectEntity(VertivPowerAssistBaseEntity, SelectEntity):
             # Should not happen if the options list is correct
             return
 
-        current_config = {
-            KEY_SHUTDOWN_TYPE: self.coordinator.data.get(KEY_SHUTDOWN_TYPE, 0),
-            KEY_BATT_TIME_MIN: self.coordinator.data.get(KEY_BATT_TIME_MIN, 0),
-            KEY_BATT_CAPACITY_PERCENT: self.coordinator.data.get(
-                KEY_BATT_CAPACITY_PERCENT, 0
-            ),
-            KEY_AFTER_X_MINUTES: self.coordinator.data.get(KEY_AFTER_X_MINUTES, 0),
-            KEY_SHUTDOWN_IF_ALL: self.coordinator.data.get(KEY_SHUTDOWN_IF_ALL, False),
-            KEY_MAINTENANCE_MODE_POST: self.coordinator.data.get(
-                KEY_MAINTENANCE_MODE_POST, False
-            ),
-            KEY_ENABLE_SCRIPTED_SHUTDOWN: self.coordinator.data.get(
-                KEY_ENABLE_SCRIPTED_SHUTDOWN, False
-            ),
-            KEY_SCRIPTED_SHUTDOWN_PATH: self.coordinator.data.get(
-                KEY_SCRIPTED_SHUTDOWN_PATH, ""
-            ),
-        }
-
-        current_config[KEY_SHUTDOWN_TYPE] = new_shutdown_type_int
-
-        await self._api.async_set_shutdown_config(current_config)
-
-        await self.coordinator.async_request_refresh()
+        await self._writer.async_write({KEY_SHUTDOWN_TYPE: new_shutdown_type_int})
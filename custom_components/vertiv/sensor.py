@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, cast
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,22 +13,31 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfElectricPotential, UnitOfTime
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityCategory
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfElectricPotential,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from . import VertivPowerAssistConfigEntry
+from .api import VertivPowerAssistApi
 from .const import (
+    DOMAIN,
     KEY_BATTERY_VOLTAGE,
     KEY_CAPACITY,
     KEY_INPUT_VOLTAGES,
     KEY_OUTPUT_VOLTAGES,
     KEY_PERCENT_LOAD,
     KEY_RUN_TIME,
-    STATUS_KEY,
 )
-from .entity import VertivPowerAssistBaseEntity
+from .entity import VertivPowerAssistBaseEntity, async_setup_ups_entities
+from .forecast import RuntimeEstimator, host_time_to_shutdown
+from .models import PowerAssistSnapshot, UpsStatus
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -35,12 +45,37 @@ class VertivPowerAssistSensorEntityDescription(SensorEntityDescription):
     """Describes a Vertiv PowerAssist Sensor Entity."""
 
     api_key: str
+    value_fn: Callable[[UpsStatus], float | None]
+    # Changes up to `deadband`, or up to `deadband_percent` of the published
+    # value, are not published; nor are changes within `min_publish_interval`
+    # seconds of the last publication, which are delayed until it elapses
+    deadband: float = 0
+    deadband_percent: float = 0
+    min_publish_interval: float = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class VertivPowerAssistForecastSensorEntityDescription(SensorEntityDescription):
+    """Describes a Vertiv PowerAssist forecast Sensor Entity."""
+
+    # Forecasts depend on several keys and on time, follow every update
+    api_key: None = None
+    # Called with the UPS model, the host data and the current monotonic time
+    value_fn: Callable[[RuntimeEstimator, PowerAssistSnapshot, float], float | None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class VertivPowerAssistMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a Vertiv PowerAssist request metric Sensor Entity."""
+
+    value_fn: Callable[[VertivPowerAssistApi], float | datetime | None]
 
 
 SENSOR_DESCRIPTIONS: tuple[VertivPowerAssistSensorEntityDescription, ...] = (
     VertivPowerAssistSensorEntityDescription(
         key="runtime_remaining",
         api_key=KEY_RUN_TIME,
+        value_fn=lambda status: status.run_time_to_empty,
         translation_key="runtime_remaining",
         native_unit_of_measurement=UnitOfTime.SECONDS,
         device_class=SensorDeviceClass.DURATION,
@@ -50,6 +85,7 @@ SENSOR_DESCRIPTIONS: tuple[VertivPowerAssistSensorEntityDescription, ...] = (
     VertivPowerAssistSensorEntityDescription(
         key="battery_capacity_percent",
         api_key=KEY_CAPACITY,
+        value_fn=lambda status: status.remaining_capacity,
         translation_key="battery_capacity_percent",
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
@@ -58,35 +94,137 @@ SENSOR_DESCRIPTIONS: tuple[VertivPowerAssistSensorEntityDescription, ...] = (
     VertivPowerAssistSensorEntityDescription(
         key="battery_voltage_reading",
         api_key=KEY_BATTERY_VOLTAGE,
+        value_fn=lambda status: status.battery_voltage,
         translation_key="battery_voltage_reading",
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=0.2,
+        min_publish_interval=60,
     ),
     VertivPowerAssistSensorEntityDescription(
         key="output_load_percent",
         api_key=KEY_PERCENT_LOAD,
+        value_fn=lambda status: status.percent_load,
         translation_key="output_load_percent",
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:gauge",  # Changed icon to better reflect load percentage
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=1,
+        min_publish_interval=30,
     ),
     VertivPowerAssistSensorEntityDescription(
         key="input_voltage_reading",
         api_key=KEY_INPUT_VOLTAGES,
+        value_fn=lambda status: status.input_voltage,
         translation_key="input_voltage_reading",
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_percent=1,
+        min_publish_interval=30,
     ),
     VertivPowerAssistSensorEntityDescription(
         key="output_voltage_reading",
         api_key=KEY_OUTPUT_VOLTAGES,
+        value_fn=lambda status: status.output_voltage,
         translation_key="output_voltage_reading",
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
+        deadband_percent=1,
+        min_publish_interval=30,
+    ),
+)
+
+FORECAST_SENSOR_DESCRIPTIONS: tuple[
+    VertivPowerAssistForecastSensorEntityDescription, ...
+] = (
+    VertivPowerAssistForecastSensorEntityDescription(
+        key="runtime_estimate",
+        value_fn=lambda estimator, data, now: estimator.runtime_at(now),
+        translation_key="runtime_estimate",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+    ),
+    VertivPowerAssistForecastSensorEntityDescription(
+        key="time_to_shutdown",
+        value_fn=lambda estimator, data, now: host_time_to_shutdown(
+            estimator, now, data.config, data.ups
+        ),
+        translation_key="time_to_shutdown",
+        icon="mdi:timer-alert",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        suggested_display_precision=0,
+    ),
+)
+
+METRIC_SENSOR_DESCRIPTIONS: tuple[
+    VertivPowerAssistMetricSensorEntityDescription, ...
+] = (
+    VertivPowerAssistMetricSensorEntityDescription(
+        key="poll_latency",
+        value_fn=lambda api: api.status_metrics.last_latency_ms,
+        translation_key="poll_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    VertivPowerAssistMetricSensorEntityDescription(
+        key="last_successful_poll",
+        value_fn=lambda api: api.status_metrics.last_success,
+        translation_key="last_successful_poll",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    VertivPowerAssistMetricSensorEntityDescription(
+        key="request_errors",
+        value_fn=lambda api: sum(
+            metrics.error_count for metrics in api.metrics.values()
+        ),
+        translation_key="request_errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    VertivPowerAssistMetricSensorEntityDescription(
+        key="request_timeouts",
+        value_fn=lambda api: sum(metrics.timeouts for metrics in api.metrics.values()),
+        translation_key="request_timeouts",
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    VertivPowerAssistMetricSensorEntityDescription(
+        key="poll_overruns",
+        value_fn=lambda api: api.poll_overruns,
+        translation_key="poll_overruns",
+        icon="mdi:timer-cancel-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    VertivPowerAssistMetricSensorEntityDescription(
+        key="bytes_received",
+        value_fn=lambda api: sum(
+            metrics.bytes_received for metrics in api.metrics.values()
+        ),
+        translation_key="bytes_received",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
     ),
 )
 
@@ -98,16 +236,41 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Vertiv PowerAssist sensors."""
 
-    entities = [
-        VertivPowerAssistSensor(config_entry, description)
-        for description in SENSOR_DESCRIPTIONS
-    ]
-
-    async_add_entities(entities)
+    async_setup_ups_entities(
+        config_entry,
+        async_add_entities,
+        lambda ups_id: [
+            *(
+                VertivPowerAssistSensor(config_entry, description, ups_id)
+                for description in SENSOR_DESCRIPTIONS
+            ),
+            *(
+                VertivPowerAssistForecastSensor(config_entry, description, ups_id)
+                for description in FORECAST_SENSOR_DESCRIPTIONS
+            ),
+        ],
+    )
+    # Metrics describe the host's client, a single entry of the host adds them
+    config_entry.async_on_unload(
+        config_entry.runtime_data["hub"].async_add_metrics_platform(
+            config_entry.entry_id,
+            lambda: async_add_entities(
+                VertivPowerAssistMetricSensor(config_entry, description)
+                for description in METRIC_SENSOR_DESCRIPTIONS
+            ),
+        )
+    )
 
 
 class VertivPowerAssistSensor(VertivPowerAssistBaseEntity, SensorEntity):
-    """Representation of a sensor entity for the Vertiv PowerAssist device."""
+    """Representation of a sensor entity for the Vertiv PowerAssist device.
+
+    Readings that jitter on every poll are filtered by the deadband and
+    minimum publish interval of their description, so they do not write a
+    recorder row per poll. Changes of availability, to or from an unknown
+    value, and of the mains or output state of the UPS are always published
+    right away. Every state write reports the last published value.
+    """
 
     entity_description: VertivPowerAssistSensorEntityDescription
 
@@ -115,34 +278,154 @@ class VertivPowerAssistSensor(VertivPowerAssistBaseEntity, SensorEntity):
         self,
         entry: VertivPowerAssistConfigEntry,
         description: VertivPowerAssistSensorEntityDescription,
+        ups_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(entry, description)
+        super().__init__(entry, description, ups_id)
         self.entity_description = description
+        self._published_value: float | None = None
+        self._published_available: bool | None = None
+        # Mains and output state of the UPS when the value was published
+        self._published_power: tuple[bool | None, bool | None] | None = None
+        # Monotonic time of the last state written
+        self._published_at: float | None = None
+        self._cancel_delayed_publish: CALLBACK_TYPE | None = None
 
     @property
-    def native_value(self) -> str | int | float | datetime | None:
-        """Return the state of the sensor."""
+    def native_value(self) -> float | None:
+        """Return the last published state of the sensor."""
+        if self._published_at is None:
+            return self._live_value()
+        return self._published_value
 
-        data = self.coordinator.data
-        if not data:
+    def _live_value(self) -> float | None:
+        """Return the latest reading, filtered or not."""
+        if (status := self.ups_status) is None:
             return None
-        status_data: dict[str, Any] | None = data.get(STATUS_KEY)
-        if status_data is None:
-            return None
-        raw_value = status_data.get(self.entity_description.api_key)
-
-        # Handle nested voltage structures: {"voltages": [..]}
-        if isinstance(raw_value, dict) and "voltages" in raw_value:
-            voltages = raw_value.get("voltages")
-            if isinstance(voltages, list) and voltages:
-                first = voltages[0]
-                if isinstance(first, (int, float, str)):
-                    return cast(int | float | str, first)
+        return self.entity_description.value_fn(status)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a delayed publication."""
+        await super().async_will_remove_from_hass()
+        if self._cancel_delayed_publish is not None:
+            self._cancel_delayed_publish()
+            self._cancel_delayed_publish = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, unless the change is filtered out."""
+        value = self._live_value()
+        available = self.available
+        previous = self._published_value
+        status = self.ups_status
+        power = None if status is None else (status.is_ac_present, status.is_ups_on)
+        description = self.entity_description
+        now = time.monotonic()
+
+        if (
+            available == self._published_available
+            and power == self._published_power
+            and value is not None
+            and previous is not None
+        ):
+            change = abs(value - previous)
+            if change <= max(
+                description.deadband, abs(previous) * description.deadband_percent / 100
+            ):
+                return
+            published_at = self._published_at or now
+            if (wait := description.min_publish_interval - (now - published_at)) > 0:
+                if self._cancel_delayed_publish is None:
+                    self._cancel_delayed_publish = async_call_later(
+                        self.hass, wait, self._async_delayed_publish
+                    )
+                return
+
+        if self._cancel_delayed_publish is not None:
+            self._cancel_delayed_publish()
+            self._cancel_delayed_publish = None
+        self._published_value = value
+        self._published_available = available
+        self._published_power = power
+        self._published_at = now
+        self.async_write_ha_state()
+
+    @callback
+    def _async_delayed_publish(self, _: datetime) -> None:
+        """Publish a change held back by the minimum publish interval."""
+        self._cancel_delayed_publish = None
+        self._handle_coordinator_update()
+
+
+class VertivPowerAssistForecastSensor(VertivPowerAssistBaseEntity, SensorEntity):
+    """Forecast of a UPS computed from its local runtime model."""
+
+    entity_description: VertivPowerAssistForecastSensorEntityDescription
+
+    def __init__(
+        self,
+        entry: VertivPowerAssistConfigEntry,
+        description: VertivPowerAssistForecastSensorEntityDescription,
+        ups_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, description, ups_id)
+        self.entity_description = description
+        self._host_coordinator = entry.runtime_data["hub"].coordinator
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        estimator = self._host_coordinator.estimators.get(self._ups_id)
+        data = self._host_coordinator.data
+        if estimator is None or data is None:
             return None
+        return self.entity_description.value_fn(estimator, data, time.monotonic())
 
-        # Only return scalar types supported by the entity
-        if isinstance(raw_value, (str, int, float, datetime)):
-            return cast(str | int | float | datetime, raw_value)
 
-        return None
+class VertivPowerAssistMetricSensor(VertivPowerAssistBaseEntity, SensorEntity):
+    """Request metric of the PowerAssist host, read from the API client.
+
+    Metrics change with every request rather than with the UPS data, so
+    these sensors are polled by Home Assistant instead of following the
+    coordinator, and stay available while the host is unreachable. They
+    belong to a device of the host, whichever entry of the host adds them.
+    """
+
+    entity_description: VertivPowerAssistMetricSensorEntityDescription
+
+    def __init__(
+        self,
+        entry: VertivPowerAssistConfigEntry,
+        description: VertivPowerAssistMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, description)
+        self.entity_description = description
+        self._api = entry.runtime_data["api"]
+        hub_key = entry.runtime_data["hub"].key
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, hub_key)},
+            name=f"PowerAssist {hub_key}",
+            manufacturer="Vertiv",
+            model="PowerAssist",
+        )
+        self._attr_unique_id = f"{hub_key}_{description.key}"
+
+    @property
+    def should_poll(self) -> bool:
+        """Return True, the metrics are not pushed by the coordinator."""
+        return True
+
+    @property
+    def available(self) -> bool:
+        """Return True, metrics are most useful when the host is failing."""
+        return True
+
+    async def async_update(self) -> None:
+        """Do nothing, the metrics are kept up to date by the API client."""
+
+    @property
+    def native_value(self) -> float | datetime | None:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self._api)
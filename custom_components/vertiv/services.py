@@ -0,0 +1,312 @@
+"""Services of the Vertiv PowerAssist integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_LABEL_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    AFTER_X_MINUTES_RANGE,
+    BATTERY_CAPACITY_PERCENT_RANGE,
+    BATTERY_TIME_MIN_RANGE,
+    BROADCAST_CONCURRENCY,
+    BROADCAST_TIMEOUT_SECONDS,
+    DOMAIN,
+    KEY_MAINTENANCE_MODE_GET,
+    TYPE_KEY_TO_INT,
+)
+from .models import CONFIG_FIELDS
+
+if TYPE_CHECKING:
+    from . import VertivPowerAssistConfigEntry
+    from .hub import VertivPowerAssistHub
+
+SERVICE_GET_TELEMETRY = "get_telemetry"
+SERVICE_SET_SHUTDOWN_CONFIG = "set_shutdown_config"
+SERVICE_BROADCAST_SHUTDOWN_CONFIG = "broadcast_shutdown_config"
+
+ATTR_WINDOW = "window"
+ATTR_INTERVAL = "interval"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_ALL = "all"
+
+GET_TELEMETRY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_WINDOW, default=timedelta(hours=1)): vol.All(
+            cv.positive_time_period, vol.Range(min=timedelta(seconds=1))
+        ),
+        vol.Optional(ATTR_INTERVAL): vol.All(
+            cv.positive_time_period, vol.Range(min=timedelta(seconds=1))
+        ),
+    }
+)
+
+# Service field to ShutdownConfig POST key, fields named after ShutdownConfig
+SHUTDOWN_CONFIG_FIELDS: dict[str, str] = {
+    attr: key for key, attr in CONFIG_FIELDS if key != KEY_MAINTENANCE_MODE_GET
+}
+
+
+def _int_range(bounds: tuple[int, int]) -> vol.All:
+    """Return a validator of an integer setting within `bounds`."""
+    return vol.All(vol.Coerce(int), vol.Range(min=bounds[0], max=bounds[1]))
+
+
+SHUTDOWN_CONFIG_SETTINGS: dict[vol.Marker, Any] = {
+    vol.Optional("shutdown_type"): vol.All(
+        vol.In(TYPE_KEY_TO_INT), TYPE_KEY_TO_INT.__getitem__
+    ),
+    vol.Optional("battery_time_remaining_minutes"): _int_range(BATTERY_TIME_MIN_RANGE),
+    vol.Optional("battery_capacity_percent"): _int_range(
+        BATTERY_CAPACITY_PERCENT_RANGE
+    ),
+    vol.Optional("after_x_minutes"): _int_range(AFTER_X_MINUTES_RANGE),
+    vol.Optional("shutdown_if_all_ups_loses_power"): cv.boolean,
+    vol.Optional("maintenance_mode_active"): cv.boolean,
+    vol.Optional("enable_scripted_shutdown"): cv.boolean,
+    vol.Optional("scripted_shutdown_file_path"): cv.string,
+}
+
+SET_SHUTDOWN_CONFIG_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            **SHUTDOWN_CONFIG_SETTINGS,
+        }
+    ),
+    cv.has_at_least_one_key(*SHUTDOWN_CONFIG_FIELDS),
+)
+BROADCAST_SHUTDOWN_CONFIG_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_LABEL_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_ALL): cv.boolean,
+            **SHUTDOWN_CONFIG_SETTINGS,
+        }
+    ),
+    cv.has_at_least_one_key(
+        ATTR_CONFIG_ENTRY_ID, ATTR_AREA_ID, ATTR_LABEL_ID, ATTR_ALL
+    ),
+    cv.has_at_least_one_key(*SHUTDOWN_CONFIG_FIELDS),
+)
+
+
+def _resolve_ups(
+    hass: HomeAssistant, device_id: str
+) -> tuple[VertivPowerAssistHub, str]:
+    """Return the hub and UPS id of a device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is not None:
+        identifiers = {
+            identifier for domain, identifier in device.identifiers if domain == DOMAIN
+        }
+        for entry_id in device.config_entries:
+            entry: VertivPowerAssistConfigEntry | None = (
+                hass.config_entries.async_get_entry(entry_id)
+            )
+            if (
+                entry is None
+                or entry.domain != DOMAIN
+                or entry.state is not ConfigEntryState.LOADED
+            ):
+                continue
+            runtime_data = entry.runtime_data
+            for identifier in identifiers:
+                # The primary UPS keeps the identifier of the config entry
+                if identifier == runtime_data["unique_id"]:
+                    ups_id = runtime_data["coordinator"].primary_ups_id
+                else:
+                    ups_id = identifier
+                hub = runtime_data["hub"]
+                data = hub.coordinator.data
+                if ups_id is not None and data is not None and ups_id in data.ups:
+                    return hub, ups_id
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="unknown_device",
+        translation_placeholders={"device_id": device_id},
+    )
+
+
+def _target_hubs(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> dict[str, VertivPowerAssistHub]:
+    """Return the hubs of the loaded entries targeted by a broadcast, by key.
+
+    An entry is targeted when listed, when `all` is set, or when one of its
+    devices is in one of the areas or has one of the labels.
+    """
+    entry_ids = set(data.get(ATTR_CONFIG_ENTRY_ID, ()))
+    area_ids = set(data.get(ATTR_AREA_ID, ()))
+    label_ids = set(data.get(ATTR_LABEL_ID, ()))
+    device_registry = dr.async_get(hass)
+
+    hubs: dict[str, VertivPowerAssistHub] = {}
+    entry: VertivPowerAssistConfigEntry
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is not ConfigEntryState.LOADED or not (
+            data.get(ATTR_ALL)
+            or entry.entry_id in entry_ids
+            or any(
+                device.area_id in area_ids or device.labels & label_ids
+                for device in dr.async_entries_for_config_entry(
+                    device_registry, entry.entry_id
+                )
+            )
+        ):
+            continue
+        hub = entry.runtime_data["hub"]
+        hubs[hub.key] = hub
+
+    if not hubs:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="no_target"
+        )
+    return hubs
+
+
+def _with_iso_times(statistics: dict[str, Any]) -> dict[str, Any]:
+    """Replace the POSIX window starts of statistics with ISO dates."""
+    for window in statistics.get("windows", ()):
+        window["start"] = dt_util.utc_from_timestamp(window["start"]).isoformat()
+    return statistics
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_get_telemetry(call: ServiceCall) -> ServiceResponse:
+        """Return statistics of the recent samples of UPS devices."""
+        end = time.time()
+        start = end - call.data[ATTR_WINDOW].total_seconds()
+        interval = call.data.get(ATTR_INTERVAL)
+        interval_seconds = None if interval is None else interval.total_seconds()
+
+        result: dict[str, Any] = {}
+        for device_id in call.data[ATTR_DEVICE_ID]:
+            hub, ups_id = _resolve_ups(hass, device_id)
+            # Restored data comes without history, until the first live poll
+            if (telemetry := hub.coordinator.telemetry.get(ups_id)) is None:
+                result[ups_id] = None
+                continue
+            statistics = telemetry.statistics(start, end, interval_seconds)
+            result[ups_id] = _with_iso_times(statistics)
+        return {"ups": result}
+
+    async def async_set_shutdown_config(call: ServiceCall) -> None:
+        """Apply several shutdown settings of UPS hosts in a single POST each."""
+        changes = {
+            key: call.data[field]
+            for field, key in SHUTDOWN_CONFIG_FIELDS.items()
+            if field in call.data
+        }
+        # The settings are host wide, devices of the same host share one POST
+        hubs = {
+            hub.key: hub
+            for hub, _ in (
+                _resolve_ups(hass, device_id) for device_id in call.data[ATTR_DEVICE_ID]
+            )
+        }
+        results = await asyncio.gather(
+            *(hub.writer.async_write(changes) for hub in hubs.values()),
+            return_exceptions=True,
+        )
+        errors = {
+            key: result
+            for key, result in zip(hubs, results, strict=True)
+            if isinstance(result, BaseException)
+        }
+        for result in errors.values():
+            if not isinstance(
+                result, (UpdateFailed, aiohttp.ClientError, TimeoutError)
+            ):
+                raise result
+        if errors:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="write_failed",
+                translation_placeholders={"hosts": ", ".join(errors)},
+            ) from next(iter(errors.values()))
+
+    async def async_broadcast_shutdown_config(call: ServiceCall) -> ServiceResponse:
+        """Apply shutdown settings to many hosts concurrently, with a report."""
+        changes = {
+            key: call.data[field]
+            for field, key in SHUTDOWN_CONFIG_FIELDS.items()
+            if field in call.data
+        }
+        hubs = _target_hubs(hass, call.data)
+        semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+        async def _async_write(hub: VertivPowerAssistHub) -> dict[str, Any]:
+            """Write the changes to a host and return how it went.
+
+            The write batch is shared with other callers and is not cancelled
+            on timeout, so a host reported as timed out may still apply it.
+            """
+            async with semaphore:
+                start = time.monotonic()
+                error: str | None = None
+                try:
+                    async with asyncio.timeout(BROADCAST_TIMEOUT_SECONDS):
+                        await hub.writer.async_write(changes)
+                except TimeoutError:
+                    error = "timeout"
+                except Exception as err:  # noqa: BLE001
+                    error = str(err) or type(err).__name__
+                latency = time.monotonic() - start
+            return {
+                "success": error is None,
+                "error": error,
+                "latency_ms": round(latency * 1000, 1),
+            }
+
+        reports = await asyncio.gather(*(_async_write(hub) for hub in hubs.values()))
+        succeeded = sum(report["success"] for report in reports)
+        return {
+            "succeeded": succeeded,
+            "failed": len(reports) - succeeded,
+            "hosts": dict(zip(hubs, reports, strict=True)),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TELEMETRY,
+        async_get_telemetry,
+        schema=GET_TELEMETRY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SHUTDOWN_CONFIG,
+        async_set_shutdown_config,
+        schema=SET_SHUTDOWN_CONFIG_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BROADCAST_SHUTDOWN_CONFIG,
+        async_broadcast_shutdown_config,
+        schema=BROADCAST_SHUTDOWN_CONFIG_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any, Final
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -12,39 +14,44 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import VertivPowerAssistConfigEntry
 from .const import (
-    KEY_AFTER_X_MINUTES,
-    KEY_BATT_CAPACITY_PERCENT,
-    KEY_BATT_TIME_MIN,
     KEY_ENABLE_SCRIPTED_SHUTDOWN,
     KEY_MAINTENANCE_MODE_GET,
     KEY_MAINTENANCE_MODE_POST,
-    KEY_SCRIPTED_SHUTDOWN_PATH,
     KEY_SHUTDOWN_IF_ALL,
-    KEY_SHUTDOWN_TYPE,
 )
 from .entity import VertivPowerAssistBaseEntity
+from .models import ShutdownConfig
 
-MAINTENANCE_MODE_DESCRIPTION: Final[SwitchEntityDescription] = SwitchEntityDescription(
+
+@dataclass(frozen=True, kw_only=True)
+class VertivPowerAssistSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a Vertiv PowerAssist Switch Entity."""
+
+    value_fn: Callable[[ShutdownConfig], bool | None]
+
+
+MAINTENANCE_MODE_DESCRIPTION: Final = VertivPowerAssistSwitchEntityDescription(
     key=KEY_MAINTENANCE_MODE_GET,  # Use the GET key for reading state from coordinator data
     translation_key="maintenance_mode",
     icon="mdi:wrench",
     entity_category=EntityCategory.CONFIG,
+    value_fn=lambda config: config.maintenance_mode,
 )
-SHUTDOWN_IF_ALL_DESCRIPTION: Final[SwitchEntityDescription] = SwitchEntityDescription(
+SHUTDOWN_IF_ALL_DESCRIPTION: Final = VertivPowerAssistSwitchEntityDescription(
     key=KEY_SHUTDOWN_IF_ALL,
     translation_key="shutdown_if_all_loses_power",
     icon="mdi:server-network-off",
     entity_category=EntityCategory.CONFIG,
+    value_fn=lambda config: config.shutdown_if_all_ups_loses_power,
 )
-ENABLE_SCRIPTED_SHUTDOWN_DESCRIPTION: Final[SwitchEntityDescription] = (
-    SwitchEntityDescription(
-        key=KEY_ENABLE_SCRIPTED_SHUTDOWN,
-        translation_key="enable_scripted_shutdown",
-        icon="mdi:script-text-outline",
-    )
+ENABLE_SCRIPTED_SHUTDOWN_DESCRIPTION: Final = VertivPowerAssistSwitchEntityDescription(
+    key=KEY_ENABLE_SCRIPTED_SHUTDOWN,
+    translation_key="enable_scripted_shutdown",
+    icon="mdi:script-text-outline",
+    value_fn=lambda config: config.enable_scripted_shutdown,
 )
 
-SWITCH_DESCRIPTIONS: Final[list[SwitchEntityDescription]] = [
+SWITCH_DESCRIPTIONS: Final[list[VertivPowerAssistSwitchEntityDescription]] = [
     MAINTENANCE_MODE_DESCRIPTION,
     SHUTDOWN_IF_ALL_DESCRIPTION,
     ENABLE_SCRIPTED_SHUTDOWN_DESCRIPTION,
@@ -70,16 +77,18 @@ async def async_setup_entry(
 class VertivPowerAssistSwitchEntity(VertivPowerAssistBaseEntity, SwitchEntity):
     """Represents a configurable boolean setting for UPS shutdown."""
 
+    entity_description: VertivPowerAssistSwitchEntityDescription
+
     def __init__(
         self,
         entry: VertivPowerAssistConfigEntry,
         coordinator: DataUpdateCoordinator,
-        description: SwitchEntityDescription,
+        description: VertivPowerAssistSwitchEntityDescription,
     ) -> None:
         """Initialize the switch entity."""
         super().__init__(entry, description)
         self.entity_description = description
-        self._api = entry.runtime_data["api"]
+        self._writer = entry.runtime_data["hub"].writer
 
         if description.key == KEY_MAINTENANCE_MODE_GET:
             self._attr_unique_id = (
@@ -89,12 +98,7 @@ class VertivPowerAssistSwitchEntity(VertivPowerAssistBaseEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the switch is on (config is enabled)."""
-        raw_value = self.coordinator.data.get(self.entity_description.key)
-
-        if isinstance(raw_value, bool):
-            return raw_value
-
-        return None
+        return self.entity_description.value_fn(self.config_data)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on (set the config parameter to True)."""
@@ -105,7 +109,7 @@ class VertivPowerAssistSwitchEntity(VertivPowerAssistBaseEntity, SwitchEntity):
         await self._async_set_config_value(False)
 
     async def _async_set_config_value(self, value: bool) -> None:
-        """Helper to create and send the full configuration payload."""
+        """Helper to queue the change of this setting."""
 
         payload_key = (
             KEY_MAINTENANCE_MODE_POST
@@ -113,28 +117,4 @@ class VertivPowerAssistSwitchEntity(VertivPowerAssistBaseEntity, SwitchEntity):
             else self.entity_description.key
         )
 
-        current_config: dict[str, Any] = {
-            KEY_SHUTDOWN_TYPE: self.coordinator.data.get(KEY_SHUTDOWN_TYPE, 0),
-            KEY_BATT_TIME_MIN: self.coordinator.data.get(KEY_BATT_TIME_MIN, 0),
-            KEY_BATT_CAPACITY_PERCENT: self.coordinator.data.get(
-                KEY_BATT_CAPACITY_PERCENT, 0
-            ),
-            KEY_AFTER_X_MINUTES: self.coordinator.data.get(KEY_AFTER_X_MINUTES, 0),
-            # Use the data values for the other switches
-            KEY_SHUTDOWN_IF_ALL: self.coordinator.data.get(KEY_SHUTDOWN_IF_ALL, False),
-            KEY_ENABLE_SCRIPTED_SHUTDOWN: self.coordinator.data.get(
-                KEY_ENABLE_SCRIPTED_SHUTDOWN, False
-            ),
-            KEY_MAINTENANCE_MODE_POST: self.coordinator.data.get(
-                KEY_MAINTENANCE_MODE_GET, False
-            ),
-            KEY_SCRIPTED_SHUTDOWN_PATH: self.coordinator.data.get(
-                KEY_SCRIPTED_SHUTDOWN_PATH, ""
-            ),
-        }
-
-        current_config[payload_key] = value
-
-        await self._api.async_set_shutdown_config(current_config)
-
-        await self.coordinator.async_request_refresh()
+        await self._writer.async_write({payload_key: value})
@@ -0,0 +1,348 @@
+"""Compact in-memory history of the UPS samples, in fixed size ring buffers."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+import math
+from typing import Any, Final
+
+from .const import TELEMETRY_RAW_SAMPLES, TELEMETRY_TIERS
+from .models import UpsStatus
+
+# Numeric fields of UpsStatus kept in the history
+FIELDS: Final = (
+    "remaining_capacity",
+    "run_time_to_empty",
+    "percent_load",
+    "battery_voltage",
+    "input_voltage",
+    "output_voltage",
+)
+# Flags of UpsStatus, packed into one bit each
+FLAGS: Final = (
+    "is_ac_present",
+    "is_charging",
+    "is_discharging",
+    "needs_replacement",
+    "is_overload",
+    "is_ups_on",
+    "below_capacity_limit",
+)
+NAN: Final = math.nan
+
+
+def _zeros(typecode: str, size: int) -> array:
+    """Return a preallocated typed array of `size` zeros."""
+    return array(typecode, bytes(array(typecode).itemsize * size))
+
+
+def pack_flags(status: UpsStatus) -> int:
+    """Return the flags of a status as a bit mask, in `FLAGS` order."""
+    mask = 0
+    for bit, flag in enumerate(FLAGS):
+        if getattr(status, flag) is True:
+            mask |= 1 << bit
+    return mask
+
+
+def unpack_flags(mask: int) -> list[str]:
+    """Return the names of the flags set in a bit mask."""
+    return [flag for bit, flag in enumerate(FLAGS) if mask & (1 << bit)]
+
+
+class _Ring:
+    """Circular index shared by the arrays of a tier."""
+
+    __slots__ = ("count", "next", "size")
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty ring of `size` slots."""
+        self.size = size
+        self.next = 0
+        self.count = 0
+
+    def advance(self) -> int:
+        """Return the slot to write next, overwriting the oldest when full."""
+        index = self.next
+        self.next = (index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        return index
+
+    def indexes(self) -> Iterator[int]:
+        """Yield the used slots, oldest first."""
+        start = (self.next - self.count) % self.size
+        for offset in range(self.count):
+            yield (start + offset) % self.size
+
+
+class RawTier:
+    """Every sample, stored as one float per field and a flag mask."""
+
+    __slots__ = ("flags", "resolution", "ring", "times", "values")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the tier with room for `size` samples."""
+        self.resolution = 0
+        self.ring = _Ring(size)
+        self.times = _zeros("d", size)
+        self.values = [_zeros("f", size) for _ in FIELDS]
+        self.flags = _zeros("H", size)
+
+    def add(self, timestamp: float, values: tuple[float, ...], flags: int) -> None:
+        """Store a sample."""
+        index = self.ring.advance()
+        self.times[index] = timestamp
+        for column, value in zip(self.values, values, strict=True):
+            column[index] = value
+        self.flags[index] = flags
+
+    def oldest(self) -> float | None:
+        """Return the time of the oldest sample kept."""
+        if not self.ring.count:
+            return None
+        return self.times[next(self.ring.indexes())]
+
+    def scan(self, start: float, end: float) -> Iterator[tuple[float, int, Any]]:
+        """Yield `(time, slot, None)` for the samples within `[start, end)`."""
+        times = self.times
+        for index in self.ring.indexes():
+            if start <= times[index] < end:
+                yield times[index], index, None
+
+    def merge_into(self, stats: _WindowStats, index: int, _: Any) -> None:
+        """Add the sample in `index` to window statistics."""
+        stats.samples += 1
+        stats.flags |= self.flags[index]
+        for field_stats, column in zip(stats.fields, self.values, strict=True):
+            field_stats.add(column[index], column[index], column[index], 1)
+
+
+class AggregateTier:
+    """Samples downsampled into buckets of `resolution` seconds.
+
+    Each bucket keeps, per field, the min, max, sum and number of values, and
+    the union of the flags seen, so windows of any size can be computed from
+    it exactly. The bucket being filled is kept apart until it is complete.
+    """
+
+    __slots__ = (
+        "_current",
+        "counts",
+        "flags",
+        "maxs",
+        "mins",
+        "resolution",
+        "ring",
+        "samples",
+        "starts",
+        "sums",
+    )
+
+    def __init__(self, resolution: int, size: int) -> None:
+        """Initialize the tier with room for `size` buckets."""
+        self.resolution = resolution
+        self.ring = _Ring(size)
+        self.starts = _zeros("d", size)
+        self.samples = _zeros("H", size)
+        self.flags = _zeros("H", size)
+        self.mins = [_zeros("f", size) for _ in FIELDS]
+        self.maxs = [_zeros("f", size) for _ in FIELDS]
+        self.sums = [_zeros("f", size) for _ in FIELDS]
+        self.counts = [_zeros("H", size) for _ in FIELDS]
+        self._current: _WindowStats | None = None
+
+    def add(self, timestamp: float, values: tuple[float, ...], flags: int) -> None:
+        """Fold a sample into its bucket, storing the previous bucket if done."""
+        bucket_start = timestamp - timestamp % self.resolution
+        current = self._current
+        if current is None or current.start != bucket_start:
+            if current is not None:
+                self._store(current)
+            current = self._current = _WindowStats(bucket_start)
+        current.samples += 1
+        current.flags |= flags
+        for field_stats, value in zip(current.fields, values, strict=True):
+            field_stats.add(value, value, value, 1)
+
+    def _store(self, bucket: _WindowStats) -> None:
+        """Write a completed bucket in the ring."""
+        index = self.ring.advance()
+        self.starts[index] = bucket.start
+        self.samples[index] = min(bucket.samples, 0xFFFF)
+        self.flags[index] = bucket.flags
+        for position, field_stats in enumerate(bucket.fields):
+            self.mins[position][index] = field_stats.minimum
+            self.maxs[position][index] = field_stats.maximum
+            self.sums[position][index] = field_stats.total
+            self.counts[position][index] = min(field_stats.count, 0xFFFF)
+
+    def oldest(self) -> float | None:
+        """Return the start of the oldest bucket kept."""
+        if self.ring.count:
+            return self.starts[next(self.ring.indexes())]
+        return None if self._current is None else self._current.start
+
+    def scan(self, start: float, end: float) -> Iterator[tuple[float, int, Any]]:
+        """Yield `(time, slot, bucket)` for the buckets within `[start, end)`."""
+        starts = self.starts
+        for index in self.ring.indexes():
+            if start <= starts[index] < end:
+                yield starts[index], index, None
+        if (current := self._current) is not None and start <= current.start < end:
+            yield current.start, -1, current
+
+    def merge_into(self, stats: _WindowStats, index: int, bucket: Any) -> None:
+        """Add the bucket in `index`, or the open `bucket`, to window statistics."""
+        if bucket is not None:
+            stats.merge(bucket)
+            return
+        stats.samples += self.samples[index]
+        stats.flags |= self.flags[index]
+        for position, field_stats in enumerate(stats.fields):
+            field_stats.add(
+                self.mins[position][index],
+                self.maxs[position][index],
+                self.sums[position][index],
+                self.counts[position][index],
+            )
+
+
+class _FieldStats:
+    """Running min, max and sum of a field, ignoring missing values."""
+
+    __slots__ = ("count", "maximum", "minimum", "total")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, minimum: float, maximum: float, total: float, count: int) -> None:
+        """Fold in the statistics of `count` values, NaN meaning no value."""
+        if not count or math.isnan(total):
+            return
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+        self.total += total
+        self.count += count
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Return the min, max and mean, or None without values."""
+        if not self.count:
+            return {"min": None, "max": None, "mean": None}
+        return {
+            "min": round(self.minimum, 3),
+            "max": round(self.maximum, 3),
+            "mean": round(self.total / self.count, 3),
+        }
+
+
+class _WindowStats:
+    """Statistics of every field over a window starting at `start`."""
+
+    __slots__ = ("fields", "flags", "samples", "start")
+
+    def __init__(self, start: float) -> None:
+        """Initialize empty statistics."""
+        self.start = start
+        self.samples = 0
+        self.flags = 0
+        self.fields = [_FieldStats() for _ in FIELDS]
+
+    def merge(self, other: _WindowStats) -> None:
+        """Fold in the statistics of another window."""
+        self.samples += other.samples
+        self.flags |= other.flags
+        for mine, theirs in zip(self.fields, other.fields, strict=True):
+            mine.add(theirs.minimum, theirs.maximum, theirs.total, theirs.count)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in a form suitable for a service response."""
+        return {
+            "samples": self.samples,
+            "flags_seen": unpack_flags(self.flags),
+            **{
+                name: field_stats.as_dict()
+                for name, field_stats in zip(FIELDS, self.fields, strict=True)
+            },
+        }
+
+
+class UpsTelemetry:
+    """History of a UPS: every recent sample, then coarser and coarser tiers.
+
+    Samples are stored in preallocated typed arrays, so the memory used by a
+    UPS is fixed from its first sample on, and each sample costs O(tiers).
+    """
+
+    __slots__ = ("_first", "tiers")
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        # Time of the first sample recorded
+        self._first: float | None = None
+        self.tiers: list[RawTier | AggregateTier] = [RawTier(TELEMETRY_RAW_SAMPLES)]
+        self.tiers.extend(
+            AggregateTier(resolution, size) for resolution, size in TELEMETRY_TIERS
+        )
+
+    def add_sample(self, timestamp: float, status: UpsStatus) -> None:
+        """Record the status of a UPS polled at POSIX time `timestamp`."""
+        values = tuple(
+            NAN if (value := getattr(status, name)) is None else float(value)
+            for name in FIELDS
+        )
+        flags = pack_flags(status)
+        if self._first is None:
+            self._first = timestamp
+        for tier in self.tiers:
+            tier.add(timestamp, values, flags)
+
+    def _tier_for(self, start: float) -> RawTier | AggregateTier:
+        """Return the finest tier reaching back to `start`.
+
+        When the history does not reach back that far, as after a restart,
+        return the finest tier still holding every sample recorded, else the
+        longest one.
+        """
+        if self._first is None:
+            return self.tiers[0]
+        for tier in self.tiers:
+            oldest = tier.oldest()
+            if oldest is not None and oldest <= start:
+                return tier
+        for tier in self.tiers:
+            oldest = tier.oldest()
+            if oldest is not None and oldest <= self._first:
+                return tier
+        return self.tiers[-1]
+
+    def statistics(
+        self, start: float, end: float, interval: float | None = None
+    ) -> dict[str, Any]:
+        """Return min, max and mean of every field over `[start, end)`.
+
+        With an `interval`, the window is split into sub-windows of that
+        length, each with its own statistics.
+        """
+        tier = self._tier_for(start)
+        step = end - start if interval is None else max(interval, tier.resolution)
+        windows: dict[int, _WindowStats] = {}
+        for timestamp, index, bucket in tier.scan(start, end):
+            position = int((timestamp - start) // step)
+            if (stats := windows.get(position)) is None:
+                stats = windows[position] = _WindowStats(start + position * step)
+            tier.merge_into(stats, index, bucket)
+
+        result: dict[str, Any] = {"resolution": tier.resolution}
+        if interval is None:
+            result.update((windows.get(0) or _WindowStats(start)).as_dict())
+        else:
+            result["windows"] = [
+                {"start": windows[position].start, **windows[position].as_dict()}
+                for position in sorted(windows)
+            ]
+        return result
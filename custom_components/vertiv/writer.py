@@ -0,0 +1,122 @@
+"""Coalescing write queue for the PowerAssist shutdown configuration."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import SECONDARY_ENDPOINT_ERRORS, VertivPowerAssistApi
+from .const import VERIFY_CONFIG_WRITES, WRITE_COALESCE_DELAY_SECONDS
+from .coordinator import VertivPowerAssistCoordinator
+from .models import ShutdownConfig
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def build_shutdown_config_payload(
+    config: ShutdownConfig, changes: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the full ShutdownConfig payload with `changes` applied."""
+    payload = config.to_payload()
+    payload.update(changes)
+    return payload
+
+
+class VertivPowerAssistConfigWriter:
+    """Merge shutdown config changes of a host into as few POSTs as possible.
+
+    Changes requested within `WRITE_COALESCE_DELAY_SECONDS` of each other are
+    merged, later values winning, and sent in a single POST built from the
+    API's cached configuration, which already reflects earlier writes.
+    Batches are posted one at a time in the order they were started.
+
+    Instead of refreshing every endpoint after a write, the written values
+    are published to the host coordinator right away. With `verify_writes`,
+    a single GET of /ShutdownConfig then verifies them and rolls the
+    published state back to what the device reports if it disagrees.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: VertivPowerAssistApi,
+        coordinator: VertivPowerAssistCoordinator,
+        verify_writes: bool = VERIFY_CONFIG_WRITES,
+    ) -> None:
+        """Initialize the writer."""
+        self._hass = hass
+        self._verify_writes = verify_writes
+        self._api = api
+        self._coordinator = coordinator
+        self._pending: dict[str, Any] = {}
+        self._batch: asyncio.Future[None] | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_write(self, changes: dict[str, Any]) -> None:
+        """Queue config changes and wait until they have been posted."""
+        self._pending.update(changes)
+        if self._batch is None:
+            self._batch = self._hass.loop.create_future()
+            self._hass.async_create_task(self._async_flush(self._batch))
+        # The batch is shared, a cancelled caller must not cancel it for others
+        await asyncio.shield(self._batch)
+
+    async def _async_flush(self, batch: asyncio.Future[None]) -> None:
+        """Post a batch once the coalescing window has elapsed."""
+        await asyncio.sleep(WRITE_COALESCE_DELAY_SECONDS)
+        async with self._lock:
+            # Changes queued from now on start a new batch
+            self._batch = None
+            changes, self._pending = self._pending, {}
+            try:
+                # The changes must be merged into the current device config,
+                # not into restored, stale or unpolled values
+                if (
+                    "/ShutdownConfig" not in self._api.config_endpoints
+                    or self._api.config_is_stale
+                ):
+                    await self._api.async_fetch_shutdown_config()
+                payload = build_shutdown_config_payload(self._api.config, changes)
+                _LOGGER.debug("Posting shutdown config changes %s", changes)
+                await self._api.async_set_shutdown_config(payload)
+            except Exception as err:  # noqa: BLE001
+                batch.set_exception(err)
+                return
+            batch.set_result(None)
+            self._async_publish_config()
+
+            if self._verify_writes:
+                await self._async_verify(payload)
+
+    async def _async_verify(self, payload: dict[str, Any]) -> None:
+        """Check a written payload against the device, rolling back on mismatch."""
+        try:
+            device_config = await self._api.async_fetch_shutdown_config()
+        except SECONDARY_ENDPOINT_ERRORS as err:
+            _LOGGER.debug("Could not verify shutdown config write: %s", err)
+            self._api.invalidate_config()
+            return
+
+        mismatched = sorted(
+            key
+            for key, value in payload.items()
+            if key in device_config and device_config[key] != value
+        )
+        if mismatched:
+            _LOGGER.warning(
+                "PowerAssist did not apply %s, reverting to the device values",
+                ", ".join(mismatched),
+            )
+            self._async_publish_config()
+
+    @callback
+    def _async_publish_config(self) -> None:
+        """Publish the API's cached configuration to the host coordinator."""
+        if (data := self._coordinator.data) is not None:
+            self._coordinator.async_set_updated_data(
+                dataclasses.replace(data, config=self._api.config)
+            )
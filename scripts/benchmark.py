@@ -0,0 +1,403 @@
+"""Benchmark suite for the refresh and entity state paths.
+
+Runs offline against local fake PowerAssist hosts started from
+`scripts/fake_powerassist.py`, in a development environment with Home
+Assistant and pytest-homeassistant-custom-component installed. It measures:
+
+- latency and throughput of `VertivPowerAssistApi.async_update_data`
+- cost of reading the state property of every entity
+- time from a host refresh to the entity states being written, for 1, 10,
+  100 and 1000 UPS spread over several hosts and config entries
+- memory used per UPS once set up
+
+Each measurement runs against a steady host, where polls return identical
+bodies, and against a discharging one, where every poll changes values.
+Results are written as a flat JSON object of metrics. `--compare` checks
+them against an earlier run and exits with status 1 on regressions.
+
+Usage: python scripts/benchmark.py [--output results.json] [--compare old.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator
+import contextlib
+from datetime import UTC, datetime
+import functools
+import json
+import math
+from pathlib import Path
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any
+
+# Make the integration importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant import loader
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PORT,
+    CONF_SCAN_INTERVAL,
+    EVENT_STATE_CHANGED,
+    __version__ as HA_VERSION,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.vertiv.api import VertivPowerAssistApi
+from custom_components.vertiv.const import CONF_FAST_SCAN_INTERVAL, DOMAIN
+from custom_components.vertiv.hub import VertivPowerAssistHub
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FAKE_SERVER = REPO_ROOT / "scripts" / "fake_powerassist.py"
+
+SCENARIOS = ("normal", "mains-loss")
+# Fast enough for values to change on every poll, slow enough not to run flat
+FAKE_SPEED = 5
+# State property read by the benchmark for each platform
+STATE_PROPERTIES = {
+    "binary_sensor": "is_on",
+    "number": "native_value",
+    "select": "current_option",
+    "sensor": "native_value",
+    "switch": "is_on",
+}
+ENTITY_ROUNDS = 2000
+# Metrics where a higher value is better, all others are lower is better
+HIGHER_IS_BETTER_SUFFIXES = ("_per_s",)
+
+
+def summarize(prefix: str, samples: list[float]) -> dict[str, float]:
+    """Return latency statistics of `samples`, given in seconds, in ms."""
+    ordered = sorted(samples)
+    return {
+        f"{prefix}.mean_ms": statistics.fmean(ordered) * 1e3,
+        f"{prefix}.p50_ms": ordered[len(ordered) // 2] * 1e3,
+        f"{prefix}.p95_ms": ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)]
+        * 1e3,
+        f"{prefix}.max_ms": ordered[-1] * 1e3,
+    }
+
+
+def free_port() -> int:
+    """Return a TCP port nobody listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_port(port: int, timeout: float = 30) -> None:
+    """Wait until a fake host accepts connections."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+@contextlib.asynccontextmanager
+async def fake_hosts(ups_counts: list[int], scenario: str) -> AsyncIterator[list[int]]:
+    """Run one fake PowerAssist host per UPS count, yielding their ports."""
+    ports = [free_port() for _ in ups_counts]
+    processes: list[asyncio.subprocess.Process] = []
+    first_index = 0
+    try:
+        for port, ups_count in zip(ports, ups_counts, strict=True):
+            processes.append(
+                await asyncio.create_subprocess_exec(
+                    sys.executable,
+                    str(FAKE_SERVER),
+                    *("--host", "127.0.0.1", "--port", str(port)),
+                    *("--ups", str(ups_count), "--first-index", str(first_index)),
+                    *(
+                        "--scenario",
+                        scenario,
+                        "--speed",
+                        str(FAKE_SPEED),
+                        "--seed",
+                        "0",
+                    ),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            )
+            first_index += ups_count
+        await asyncio.gather(*(wait_for_port(port) for port in ports))
+        yield ports
+    finally:
+        for process in processes:
+            process.terminate()
+        await asyncio.gather(*(process.wait() for process in processes))
+
+
+def split_ups(total: int, ups_per_host: int) -> list[int]:
+    """Spread `total` UPS over as few hosts as `ups_per_host` allows."""
+    hosts = math.ceil(total / ups_per_host)
+    return [total // hosts + (index < total % hosts) for index in range(hosts)]
+
+
+async def bench_api(
+    hass: HomeAssistant, port: int, ups_count: int, rounds: int, concurrency: int
+) -> dict[str, float]:
+    """Measure `async_update_data` against a single host."""
+    api = VertivPowerAssistApi(hass, "127.0.0.1", port, "benchmark")
+    try:
+        # Warm up the connection pool and the config cache
+        await api.async_update_data()
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        api.invalidate_config()
+        snapshot = await api.async_update_data()
+        snapshot_bytes = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del snapshot
+
+        latencies = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await api.async_update_data()
+            latencies.append(time.perf_counter() - start)
+
+        async def worker() -> None:
+            for _ in range(rounds // concurrency):
+                await api.async_update_data()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await api.async_close()
+
+    return {
+        **summarize("update_data", latencies),
+        "update_data.sequential_per_s": len(latencies) / sum(latencies),
+        "update_data.concurrent_per_s": rounds // concurrency * concurrency / elapsed,
+        "update_data.memory_bytes_per_ups": snapshot_bytes / ups_count,
+    }
+
+
+async def setup_entries(
+    hass: HomeAssistant, ports: list[int], ups_counts: list[int], entries_per_host: int
+) -> int:
+    """Set up config entries for every fake host, returning their number."""
+    entries: list[MockConfigEntry] = []
+    first_index = 0
+    for port, ups_count in zip(ports, ups_counts, strict=True):
+        # Each entry claims one UPS, the first one also gets the unclaimed UPS
+        for index in range(first_index, first_index + min(entries_per_host, ups_count)):
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                title=f"Fake UPS {index + 1}",
+                unique_id=f"FAKE{index:012d}",
+                data={CONF_HOST: "127.0.0.1", CONF_PORT: port, CONF_NAME: "Fake"},
+                # Keep the pollers out of the way of the timed refreshes
+                options={CONF_SCAN_INTERVAL: 300, CONF_FAST_SCAN_INTERVAL: 60},
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+        first_index += ups_count
+
+    for entry in entries:
+        await hass.config_entries.async_setup(entry.entry_id)
+        if entry.state is not ConfigEntryState.LOADED:
+            raise RuntimeError(f"{entry.title} failed to set up: {entry.state}")
+    await hass.async_block_till_done()
+    return len(entries)
+
+
+async def bench_refresh(hass: HomeAssistant, rounds: int) -> dict[str, float]:
+    """Measure the time from refreshing every host to its states being written."""
+    hubs: list[VertivPowerAssistHub] = list(hass.data[DOMAIN].values())
+    state_writes = 0
+
+    @callback
+    def _count_state_write(event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+    samples = []
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await asyncio.gather(*(hub.coordinator.async_refresh() for hub in hubs))
+            await hass.async_block_till_done()
+            samples.append(time.perf_counter() - start)
+    finally:
+        unsub()
+
+    return {
+        **summarize("refresh_to_state", samples),
+        "refresh_to_state.state_writes_per_refresh": state_writes / rounds,
+    }
+
+
+def bench_entities(hass: HomeAssistant) -> dict[str, float]:
+    """Measure the cost of reading the state property of every entity."""
+    costs: dict[str, list[float]] = defaultdict(list)
+    for entity_platform in async_get_platforms(hass, DOMAIN):
+        domain = entity_platform.domain
+        state_property = STATE_PROPERTIES[domain]
+        for entity in entity_platform.entities.values():
+            read = functools.partial(getattr, entity, state_property)
+            best = min(timeit.repeat(read, number=ENTITY_ROUNDS, repeat=3))
+            costs[f"entity.{domain}.{state_property}"].append(best / ENTITY_ROUNDS)
+
+    results: dict[str, float] = {}
+    for key, samples in costs.items():
+        results[f"{key}.mean_us"] = statistics.fmean(samples) * 1e6
+        results[f"{key}.max_us"] = max(samples) * 1e6
+    return results
+
+
+async def run_scale(
+    args: argparse.Namespace, total_ups: int, scenario: str
+) -> dict[str, float]:
+    """Run every benchmark for `total_ups` UPS playing `scenario`."""
+    ups_counts = split_ups(total_ups, args.ups_per_host)
+    results: dict[str, float] = {}
+    async with (
+        fake_hosts(ups_counts, scenario) as ports,
+        async_test_home_assistant() as hass,
+    ):
+        # Let the loader find custom_components/vertiv in this repository
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+        results.update(
+            await bench_api(
+                hass, ports[0], ups_counts[0], args.rounds, args.concurrency
+            )
+        )
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        results["entries"] = await setup_entries(
+            hass, ports, ups_counts, args.entries_per_host
+        )
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results["setup.memory_bytes_per_ups"] = used / total_ups
+
+        results.update(await bench_refresh(hass, args.rounds))
+        results.update(bench_entities(hass))
+
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Return a description of every metric worse than `baseline`."""
+    regressions = []
+    for key, value in results.items():
+        old = baseline.get(key)
+        if not old or key.endswith(".entries") or "state_writes" in key:
+            continue
+        change = (value - old) / old
+        if key.endswith(HIGHER_IS_BETTER_SUFFIXES):
+            change = -change
+        if change > tolerance:
+            regressions.append(f"{key}: {old:.4g} -> {value:.4g} ({change:+.0%})")
+    return regressions
+
+
+def git_revision() -> str | None:
+    """Return the revision of the benchmarked tree, if known."""
+    with contextlib.suppress(OSError, subprocess.CalledProcessError):
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    return None
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the suite and return its report."""
+    metrics: dict[str, float] = {}
+    for total_ups in args.scales:
+        for scenario in SCENARIOS:
+            print(f"Benchmarking {total_ups} UPS, {scenario}", file=sys.stderr)
+            scale_results = await run_scale(args, total_ups, scenario)
+            metrics.update(
+                (f"ups={total_ups}.{scenario}.{key}", value)
+                for key, value in scale_results.items()
+            )
+    return {
+        "meta": {
+            "date": datetime.now(UTC).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "homeassistant": HA_VERSION,
+            "machine": platform.machine(),
+            "rounds": args.rounds,
+            "ups_per_host": args.ups_per_host,
+            "entries_per_host": args.entries_per_host,
+        },
+        "metrics": metrics,
+    }
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--ups-per-host", type=int, default=100)
+    parser.add_argument("--entries-per-host", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--output", type=Path, help="write the results to a file")
+    parser.add_argument("--compare", type=Path, help="results of an earlier run")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed relative slowdown"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(async_main(args))
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(report["metrics"], baseline["metrics"], args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare the JSON decoding paths for PowerAssist status payloads.
+
+The old path mirrors `aiohttp.ClientResponse.json()`: the body is decoded to
+text, then parsed by the standard library. The new path hands the raw bytes
+straight to orjson, as `homeassistant.util.json.json_loads` does.
+
+Usage: python scripts/benchmark_json.py [--ups 1 4 16] [--rounds 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+import orjson
+
+
+def build_ups(index: int) -> dict[str, Any]:
+    """Return one UPS as listed by the PowerAssist main endpoint."""
+    return {
+        "upsUniqueIdentifier": f"PS1234567890{index:04d}",
+        "name": f"Vertiv UPS {index}",
+        "manufacturer": "Vertiv",
+        "modelNumber": "GXT5-1500LVRT2UXL",
+        "version": "1.4.2.0",
+        "serialNumber": f"2133{index:08d}",
+        "connectionType": "USB",
+        "isCommunicationLost": False,
+        "status": {
+            "runTimeToEmptyInSeconds": 1380 + index,
+            "remainingCapacityInPercent": 100,
+            "batteryVoltage": 27.3,
+            "percentLoad": 23,
+            "inputVoltages": {"voltages": [121.5]},
+            "outputVoltages": {"voltages": [120.1]},
+            "inputFrequency": 60.0,
+            "outputFrequency": 60.0,
+            "isAcPresent": True,
+            "isCharging": False,
+            "isDischarging": False,
+            "needsReplacement": False,
+            "isOverload": False,
+            "isUpsOn": True,
+            "belowRemainingCapacityLimit": False,
+            "lastSelfTestResult": "Passed",
+            "alarms": [],
+        },
+    }
+
+
+def build_status_payload(ups_count: int) -> bytes:
+    """Return a main endpoint body listing `ups_count` UPS."""
+    return json.dumps([build_ups(index) for index in range(ups_count)]).encode()
+
+
+def stdlib_path(body: bytes) -> Any:
+    """Decode like `aiohttp.ClientResponse.json()`."""
+    return json.loads(body.decode("utf-8"))
+
+
+def orjson_path(body: bytes) -> Any:
+    """Decode the raw bytes with orjson."""
+    return orjson.loads(body)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ups", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--rounds", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'UPS':>4} {'bytes':>7} {'stdlib µs':>10} {'orjson µs':>10} {'speedup':>8}")
+    for ups_count in args.ups:
+        body = build_status_payload(ups_count)
+        assert stdlib_path(body) == orjson_path(body)
+        results = []
+        for path in (stdlib_path, orjson_path):
+            best = min(
+                timeit.repeat(
+                    lambda path=path, body=body: path(body),
+                    number=args.rounds,
+                    repeat=5,
+                )
+            )
+            results.append(best / args.rounds * 1e6)
+        stdlib_us, orjson_us = results
+        print(
+            f"{ups_count:>4} {len(body):>7} {stdlib_us:>10.2f} {orjson_us:>10.2f}"
+            f" {stdlib_us / orjson_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
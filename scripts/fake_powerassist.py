@@ -0,0 +1,396 @@
+"""Stand-in for a Vertiv PowerAssist host, for development and load testing.
+
+Serves the endpoints used by the integration over HTTPS (with a throwaway
+self-signed certificate) on the PowerAssist port:
+
+    GET  /api/PowerAssist                     list of UPS with their status
+    GET  /api/PowerAssist/ShutdownConfig      shutdown configuration
+    POST /api/PowerAssist/ShutdownConfig      update the shutdown configuration
+    GET  /api/PowerAssist/InMaintenanceMode   maintenance mode flag
+    POST /api/PowerAssist/UpsName             rename a UPS
+
+and `GET /fake/stats` with the number of requests served per endpoint.
+
+The UPS follow a scenario: a list of phases, each setting the AC state, the
+load and the faults injected for its duration. Batteries discharge and
+recharge along a simple load dependent curve, `--speed` compresses time so a
+full discharge can be watched in minutes. A scenario is either one of the
+built-in ones (see `--list`) or a JSON file holding a list of phases, e.g.
+
+    [
+        {"duration": 30},
+        {"duration": 300, "ac_present": false, "load": 40},
+        {"duration": 60, "error_rate": 0.5},
+        {}
+    ]
+
+Usage: python scripts/fake_powerassist.py [--scenario mains-loss] [--ups 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import dataclasses
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import random
+import ssl
+import subprocess
+import tempfile
+import time
+from typing import Any
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger("fake_powerassist")
+
+API_ENDPOINT = "/api/PowerAssist"
+DEFAULT_PORT = 8210
+
+# Runtime of a full battery at 100 % load, scaled by a Peukert-like exponent
+FULL_LOAD_RUNTIME_SECONDS = 300
+PEUKERT_EXPONENT = 1.2
+# Time to recharge an empty battery on mains
+RECHARGE_SECONDS = 4 * 3600
+LOW_CAPACITY_LIMIT = 20
+NOMINAL_INPUT_VOLTAGE = 120.0
+
+
+@dataclass(frozen=True, slots=True)
+class Phase:
+    """A period of a scenario; a phase without duration lasts forever."""
+
+    duration: float | None = None
+    ac_present: bool = True
+    load: float = 25.0
+    # Delay added to every response
+    latency: float = 0.0
+    # Share of requests answered with a 5xx, never answered or with bad JSON
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    malformed_rate: float = 0.0
+
+
+SCENARIOS: dict[str, list[Phase]] = {
+    "normal": [Phase()],
+    "mains-loss": [Phase(30), Phase(ac_present=False, load=40)],
+    "outage-recovery": [
+        Phase(30),
+        Phase(120, ac_present=False, load=40),
+        Phase(),
+    ],
+    "flapping": [Phase(10), Phase(5, ac_present=False)] * 6 + [Phase()],
+    "slow": [Phase(latency=3)],
+    "timeouts": [Phase(timeout_rate=0.3)],
+    "errors": [Phase(error_rate=0.3)],
+    "malformed": [Phase(malformed_rate=0.3)],
+    "degraded-outage": [
+        Phase(30),
+        Phase(ac_present=False, load=40, latency=1, error_rate=0.2),
+    ],
+}
+
+
+@dataclass(slots=True)
+class FakeUps:
+    """Simulated state of a UPS."""
+
+    index: int
+    name: str
+    capacity: float = 100.0
+    # Load of this UPS relative to the load of the scenario phase
+    load_factor: float = 1.0
+    load: float = 0.0
+    ac_present: bool = True
+
+    @property
+    def unique_id(self) -> str:
+        """Return the identifier PowerAssist reports for the UPS."""
+        return f"FAKE{self.index:012d}"
+
+    def runtime_at_load(self) -> float:
+        """Return the runtime of a full battery at the current load, in seconds."""
+        load = max(self.load, 1.0)
+        return FULL_LOAD_RUNTIME_SECONDS * (100.0 / load) ** PEUKERT_EXPONENT
+
+    def advance(self, elapsed: float, phase: Phase) -> None:
+        """Move the simulation forward by `elapsed` seconds of UPS time."""
+        self.ac_present = phase.ac_present
+        self.load = min(phase.load * self.load_factor, 150.0)
+        if self.ac_present:
+            self.capacity += 100.0 * elapsed / RECHARGE_SECONDS
+        else:
+            self.capacity -= 100.0 * elapsed / self.runtime_at_load()
+        self.capacity = min(max(self.capacity, 0.0), 100.0)
+
+    def as_json(self) -> dict[str, Any]:
+        """Return the UPS as listed by the main endpoint."""
+        is_on = self.ac_present or self.capacity > 0
+        on_battery = not self.ac_present and is_on
+        if self.ac_present:
+            battery_voltage = 27.3 if self.capacity >= 100 else 26.8
+        else:
+            battery_voltage = 21.0 + 5.5 * self.capacity / 100
+        return {
+            "upsUniqueIdentifier": self.unique_id,
+            "name": self.name,
+            "manufacturer": "Vertiv",
+            "modelNumber": "GXT5-1500LVRT2UXL",
+            "version": "1.4.2.0",
+            "serialNumber": f"FAKE{self.index:08d}",
+            "connectionType": "USB",
+            "isCommunicationLost": False,
+            "status": {
+                "runTimeToEmptyInSeconds": round(
+                    self.runtime_at_load() * self.capacity / 100
+                ),
+                "remainingCapacityInPercent": round(self.capacity),
+                "batteryVoltage": round(battery_voltage, 1),
+                "percentLoad": round(self.load) if is_on else 0,
+                "inputVoltages": {
+                    "voltages": [NOMINAL_INPUT_VOLTAGE if self.ac_present else 0.0]
+                },
+                "outputVoltages": {
+                    "voltages": [NOMINAL_INPUT_VOLTAGE if is_on else 0.0]
+                },
+                "isAcPresent": self.ac_present,
+                "isCharging": self.ac_present and self.capacity < 100,
+                "isDischarging": on_battery,
+                "needsReplacement": False,
+                "isOverload": self.load > 100,
+                "isUpsOn": is_on,
+                "belowRemainingCapacityLimit": self.capacity < LOW_CAPACITY_LIMIT,
+            },
+        }
+
+
+@dataclass
+class FakePowerAssist:
+    """Simulated PowerAssist host running a scenario."""
+
+    phases: list[Phase]
+    ups: list[FakeUps]
+    speed: float = 1.0
+    loop: bool = False
+    shutdown_config: dict[str, Any] = field(
+        default_factory=lambda: {
+            "shutdownType": 0,
+            "batteryTimeRemainingMinutes": 5,
+            "batteryCapacityPercent": 20,
+            "afterXMinutes": 10,
+            "shutdownIfAllUpsLosesPower": False,
+            "maintenanceModeActive": False,
+            "enableScriptedShutdown": False,
+            "scriptedShutdownFilePath": "",
+        }
+    )
+    stats: Counter[str] = field(default_factory=Counter)
+    _started: float = field(default_factory=time.monotonic)
+    _last_advance: float = field(default_factory=time.monotonic)
+
+    def current_phase(self) -> Phase:
+        """Return the phase of the scenario at the current time."""
+        elapsed = (time.monotonic() - self._started) * self.speed
+        total = sum(phase.duration or 0 for phase in self.phases)
+        if self.loop and total and all(phase.duration for phase in self.phases):
+            elapsed %= total
+        for phase in self.phases:
+            if phase.duration is None or elapsed < phase.duration:
+                return phase
+            elapsed -= phase.duration
+        return self.phases[-1]
+
+    def advance(self) -> Phase:
+        """Bring every UPS up to date and return the current phase."""
+        now = time.monotonic()
+        elapsed = (now - self._last_advance) * self.speed
+        self._last_advance = now
+        phase = self.current_phase()
+        for ups in self.ups:
+            ups.advance(elapsed, phase)
+        return phase
+
+    @web.middleware
+    async def inject_faults(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        """Apply the latency and faults of the current phase to a request."""
+        if request.path.startswith("/fake/"):
+            return await handler(request)
+        phase = self.advance()
+        self.stats[f"{request.method} {request.path}"] += 1
+        if phase.latency:
+            await asyncio.sleep(phase.latency)
+
+        draw = random.random()
+        if draw < phase.timeout_rate:
+            self.stats["fault timeout"] += 1
+            # Never answer, the client gives up on its own
+            await asyncio.sleep(3600)
+        draw -= phase.timeout_rate
+        if draw < phase.error_rate:
+            self.stats["fault error"] += 1
+            raise web.HTTPServiceUnavailable(text="Simulated failure")
+        draw -= phase.error_rate
+
+        response = await handler(request)
+        if draw < phase.malformed_rate and isinstance(response, web.Response):
+            self.stats["fault malformed"] += 1
+            body = response.body if isinstance(response.body, bytes) else b"{}"
+            response.body = body[: len(body) // 2] or b"{"
+        return response
+
+    async def get_status(self, request: web.Request) -> web.Response:
+        """Return every UPS with its status."""
+        return web.json_response([ups.as_json() for ups in self.ups])
+
+    async def get_shutdown_config(self, request: web.Request) -> web.Response:
+        """Return the shutdown configuration."""
+        return web.json_response({"shutdownConfig": self.shutdown_config})
+
+    async def post_shutdown_config(self, request: web.Request) -> web.Response:
+        """Update the shutdown configuration."""
+        payload = await request.json()
+        unknown = payload.keys() - self.shutdown_config.keys()
+        if unknown:
+            raise web.HTTPBadRequest(text=f"Unknown keys: {sorted(unknown)}")
+        self.shutdown_config.update(payload)
+        _LOGGER.info("Shutdown config updated: %s", payload)
+        return web.Response()
+
+    async def get_maintenance_mode(self, request: web.Request) -> web.Response:
+        """Return whether maintenance mode is active."""
+        return web.json_response(self.shutdown_config["maintenanceModeActive"])
+
+    async def post_ups_name(self, request: web.Request) -> web.Response:
+        """Rename a UPS."""
+        payload = await request.json()
+        for ups in self.ups:
+            if ups.unique_id == payload.get("upsUniqueIdentifier"):
+                ups.name = payload["name"]
+                return web.Response()
+        raise web.HTTPNotFound(text="Unknown UPS")
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        """Return the number of requests served and faults injected."""
+        return web.json_response(
+            {"phase": dataclasses.asdict(self.current_phase()), **self.stats}
+        )
+
+    def build_app(self) -> web.Application:
+        """Return the web application serving this host."""
+        app = web.Application(middlewares=[self.inject_faults])
+        app.router.add_get(API_ENDPOINT, self.get_status)
+        app.router.add_get(f"{API_ENDPOINT}/ShutdownConfig", self.get_shutdown_config)
+        app.router.add_post(f"{API_ENDPOINT}/ShutdownConfig", self.post_shutdown_config)
+        app.router.add_get(
+            f"{API_ENDPOINT}/InMaintenanceMode", self.get_maintenance_mode
+        )
+        app.router.add_post(f"{API_ENDPOINT}/UpsName", self.post_ups_name)
+        app.router.add_get("/fake/stats", self.get_stats)
+        return app
+
+
+def load_scenario(name_or_path: str) -> list[Phase]:
+    """Return a built-in scenario, or the phases listed in a JSON file."""
+    if name_or_path in SCENARIOS:
+        return SCENARIOS[name_or_path]
+    phases = json.loads(Path(name_or_path).read_text(encoding="utf-8"))
+    if not isinstance(phases, list) or not phases:
+        raise ValueError(f"{name_or_path} must hold a non empty list of phases")
+    return [Phase(**phase) for phase in phases]
+
+
+def build_ssl_context(
+    directory: str, cert: str | None, key: str | None
+) -> ssl.SSLContext:
+    """Return a server context, generating a self-signed certificate if needed."""
+    if cert is None or key is None:
+        cert = f"{directory}/cert.pem"
+        key = f"{directory}/key.pem"
+        subprocess.run(
+            [
+                "openssl",
+                "req",
+                "-x509",
+                "-newkey",
+                "rsa:2048",
+                "-nodes",
+                "-days",
+                "1",
+                "-subj",
+                "/CN=fake-powerassist",
+                "-keyout",
+                key,
+                "-out",
+                cert,
+            ],
+            check=True,
+            capture_output=True,
+        )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+def build_host(args: argparse.Namespace) -> FakePowerAssist:
+    """Return the simulated host described by the command line."""
+    rng = random.Random(args.seed)
+    ups = [
+        FakeUps(
+            index=index,
+            name=f"Fake UPS {index + 1}",
+            load_factor=rng.uniform(0.6, 1.4) if index else 1.0,
+        )
+        for index in range(args.first_index, args.first_index + args.ups)
+    ]
+    return FakePowerAssist(
+        phases=load_scenario(args.scenario),
+        ups=ups,
+        speed=args.speed,
+        loop=args.loop,
+    )
+
+
+def main() -> None:
+    """Run the fake PowerAssist host until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--scenario", default="normal", help="name or JSON file")
+    parser.add_argument("--ups", type=int, default=1, help="number of UPS")
+    parser.add_argument(
+        "--first-index", type=int, default=0, help="index of the first UPS id"
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="time factor")
+    parser.add_argument("--loop", action="store_true", help="repeat the scenario")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-tls", action="store_true", help="serve plain HTTP")
+    parser.add_argument("--cert", help="PEM certificate instead of a generated one")
+    parser.add_argument("--key", help="PEM private key of --cert")
+    parser.add_argument("--list", action="store_true", help="list the scenarios")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, phases in SCENARIOS.items():
+            print(f"{name}: {len(phases)} phase(s)")
+        return
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    random.seed(args.seed)
+    host = build_host(args)
+    with tempfile.TemporaryDirectory() as directory:
+        ssl_context = (
+            None if args.no_tls else build_ssl_context(directory, args.cert, args.key)
+        )
+        web.run_app(
+            host.build_app(), host=args.host, port=args.port, ssl_context=ssl_context
+        )
+
+
+if __name__ == "__main__":
+    main()
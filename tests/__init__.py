@@ -0,0 +1 @@
+"""Tests for the Vertiv PowerAssist integration."""
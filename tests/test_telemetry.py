@@ -0,0 +1,80 @@
+"""Tests for the telemetry history of the Vertiv PowerAssist integration."""
+
+from __future__ import annotations
+
+from custom_components.vertiv.models import UpsStatus
+from custom_components.vertiv.telemetry import UpsTelemetry
+
+# Aligned on the coarsest tier, so bucket boundaries are predictable
+T0 = 1_700_000_100.0
+POLL = 2.0
+
+
+def _status(load: float) -> UpsStatus:
+    """Return a UPS status on mains with `load` percent load."""
+    return UpsStatus(
+        run_time_to_empty=1800.0,
+        remaining_capacity=100.0,
+        battery_voltage=27.0,
+        percent_load=load,
+        input_voltage=120.0,
+        output_voltage=120.0,
+        input_voltages=(120.0,),
+        output_voltages=(120.0,),
+        is_ac_present=True,
+        is_charging=False,
+        is_discharging=False,
+        needs_replacement=False,
+        is_overload=False,
+        is_ups_on=True,
+        below_capacity_limit=False,
+    )
+
+
+def _telemetry(samples: int) -> UpsTelemetry:
+    """Return a history of `samples` polls, `POLL` seconds apart from T0."""
+    telemetry = UpsTelemetry()
+    for index in range(samples):
+        telemetry.add_sample(T0 + index * POLL, _status(float(index % 50)))
+    return telemetry
+
+
+def test_window_longer_than_history() -> None:
+    """A window reaching before the first sample covers every sample."""
+    telemetry = _telemetry(145)
+    end = T0 + 290
+    result = telemetry.statistics(end - 390, end)
+
+    assert result["resolution"] == 0
+    assert result["samples"] == 145
+    assert result["percent_load"] == {"min": 0.0, "max": 49.0, "mean": 23.724}
+
+
+def test_interval_with_history_shorter_than_window() -> None:
+    """Intervals are kept when only the raw samples hold the history."""
+    telemetry = _telemetry(145)
+    end = T0 + 290
+    result = telemetry.statistics(end - 3600, end, interval=60)
+
+    assert result["resolution"] == 0
+    windows = result["windows"]
+    assert sum(window["samples"] for window in windows) == 145
+    assert [window["start"] for window in windows] == [
+        end - 3600 + 60 * position for position in range(55, 60)
+    ]
+
+
+def test_interval_below_resolution() -> None:
+    """An interval finer than the tier used is widened to its resolution."""
+    # The raw tier only keeps the last hour of these
+    telemetry = _telemetry(4000)
+    end = T0 + 4000 * POLL
+    start = end - 7200
+    result = telemetry.statistics(start, end, interval=10)
+
+    assert result["resolution"] == 60
+    starts = [window["start"] for window in result["windows"]]
+    assert starts == sorted(starts)
+    assert all((window_start - start) % 60 == 0 for window_start in starts)
+    # From the first whole minute of the window to the open bucket included
+    assert sum(window["samples"] for window in result["windows"]) == 3580